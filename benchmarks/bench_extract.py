@@ -0,0 +1,81 @@
+"""Benchmark the HTML-to-text extraction engines on saved filings.
+
+Usage:
+    python benchmarks/bench_extract.py                    # every file in benchmarks/fixtures/
+    python benchmarks/bench_extract.py path/to/10k.htm ...
+    python benchmarks/bench_extract.py --fetch URL ...    # save EDGAR docs as fixtures first
+
+Each engine's output is checked against the bs4 reference engine.
+"""
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sayvdo.core import edgar, extract  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def fetch_fixture(url: str) -> str:
+    resp = edgar.get(url, timeout=60)
+    resp.raise_for_status()
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    path = os.path.join(FIXTURE_DIR, url.rstrip("/").rsplit("/", 1)[-1])
+    with open(path, "w") as f:
+        f.write(resp.text)
+    print(f"saved {path} ({len(resp.text) / 1e6:.1f} MB)")
+    return path
+
+
+def first_difference(a: str, b: str) -> str:
+    for i, (x, y) in enumerate(zip(a.splitlines(), b.splitlines())):
+        if x != y:
+            return f"line {i}: {x[:60]!r} != {y[:60]!r}"
+    return f"length {len(a):,} != {len(b):,}"
+
+
+def bench(path: str, engines: list[str], repeat: int):
+    with open(path, errors="replace") as f:
+        html = f.read()
+    size_mb = len(html) / 1e6
+    print(f"\n{os.path.basename(path)} — {size_mb:.1f} MB")
+
+    reference = extract.extract_text(html, "bs4")
+    for engine in engines:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            text = extract.extract_text(html, engine)
+            best = min(best, time.perf_counter() - start)
+        same = "identical" if text == reference else f"DIFFERS ({first_difference(reference, text)})"
+        print(f"  {engine:<7} {best:8.3f}s  {size_mb / best:7.1f} MB/s  {same}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark filing text extraction engines")
+    parser.add_argument("files", nargs="*", help="Saved filing HTML (default: benchmarks/fixtures/*)")
+    parser.add_argument("--fetch", nargs="+", metavar="URL", default=[],
+                        help="Download EDGAR documents into benchmarks/fixtures/ first")
+    parser.add_argument("--engine", action="append", choices=list(extract.ENGINES),
+                        help="Engine(s) to time (default: all available)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per engine; best is reported")
+    args = parser.parse_args()
+
+    files = list(args.files) + [fetch_fixture(url) for url in args.fetch]
+    if not files:
+        files = sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.htm*")))
+    if not files:
+        parser.error(f"no fixtures — pass files or use --fetch (looked in {FIXTURE_DIR})")
+
+    engines = args.engine or extract.available_engines()
+    for path in files:
+        bench(path, engines, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
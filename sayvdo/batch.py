@@ -0,0 +1,111 @@
+"""Batch engine — score a whole ticker universe with progress and resume.
+
+Several tickers are scored at once; EDGAR traffic is already paced by the
+shared rate limiter and model calls by the process-wide limit in llm.
+Finished tickers are committed to history in small batches (at most a few
+seconds behind), so history doubles as the checkpoint: a rerun for the same
+quarter skips everything already done.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from sayvdo.core import scorer, history
+from sayvdo.worklog import log_scan
+
+DEFAULT_CONCURRENCY = 4
+
+
+def load_tickers(path: str) -> list[str]:
+    """Read tickers from a file — whitespace/comma separated, '#' comments allowed."""
+    tickers = []
+    seen = set()
+    with open(path) as f:
+        for line in f:
+            line = line.split("#", 1)[0]
+            for token in line.replace(",", " ").split():
+                ticker = token.strip().upper()
+                if ticker and ticker not in seen:
+                    seen.add(ticker)
+                    tickers.append(ticker)
+    return tickers
+
+
+def _fmt_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+def _score_and_save(ticker: str, quarter: str, writer: history.BatchWriter) -> dict:
+    result = scorer.run(ticker, quarter=quarter)
+    if result["composite_score"] is None:
+        # Not saved, so a resumed run tries the ticker again
+        raise RuntimeError("no dimension could be scored")
+    writer.save(result)
+    log_scan(ticker, result["composite_score"], result["quarter"])
+    return result
+
+
+def run_batch(tickers: list[str], quarter: str | None = None,
+              concurrency: int = DEFAULT_CONCURRENCY, resume: bool = True) -> dict:
+    """Score `tickers` for `quarter`. Returns {"scored", "skipped", "failed"}."""
+    quarter = quarter or scorer._current_quarter()
+    tickers = [t.upper() for t in tickers]
+
+    skipped = []
+    if resume:
+        done_already = history.get_scored_tickers(quarter)
+        skipped = [t for t in tickers if t in done_already]
+        tickers = [t for t in tickers if t not in done_already]
+
+    total = len(tickers)
+    print(f"Batch {quarter}: {total} to score, {len(skipped)} already done, {concurrency} at a time")
+    scored, failed = [], {}
+    if not tickers:
+        return {"scored": scored, "skipped": skipped, "failed": failed}
+
+    started = time.monotonic()
+    # Results land in history in small batched transactions rather than one
+    # commit per ticker; closing the writer flushes whatever is left
+    writer = history.BatchWriter()
+    pool = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="sayvdo-batch")
+    futures = {pool.submit(_score_and_save, t, quarter, writer): t for t in tickers}
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ticker = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    failed[ticker] = str(e)
+                    line = f"ERROR: {e}"
+                else:
+                    scored.append(ticker)
+                    line = f"{result['composite_score']:>3}/100  {result['verdict']}"
+                    if result.get("missing_dimensions"):
+                        line += f"  ({len(result['missing_dimensions'])} missing)"
+
+                finished = len(scored) + len(failed)
+                elapsed = time.monotonic() - started
+                rate = finished / elapsed if elapsed else 0.0
+                eta = (total - finished) / rate if rate else 0.0
+                print(f"  [{finished:>{len(str(total))}}/{total}] {ticker:6s} → {line}"
+                      f"  | {rate * 60:.1f}/min, ETA {_fmt_duration(eta)}")
+    except KeyboardInterrupt:
+        print(f"\nInterrupted — {len(scored)} scored; scans already running will finish "
+              f"and be saved. Rerun to resume.")
+        raise
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        writer.close()
+
+    elapsed = time.monotonic() - started
+    print(f"Done in {_fmt_duration(elapsed)}: {len(scored)} scored, {len(failed)} failed, "
+          f"{len(skipped)} skipped")
+    return {"scored": scored, "skipped": skipped, "failed": failed}
@@ -0,0 +1,153 @@
+"""Content-addressed cache of LLM dimension results.
+
+Entries are keyed by (dimension, prompt-template version, model id, SHA-256 of
+the prompt text), so an unchanged filing scored by an unchanged prompt is
+answered from disk instead of the model. Stored in SQLite with a total size
+cap; the least recently used entries are evicted first.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DB_PATH = os.path.expanduser("~/.sayvdo_cache/llm_cache.db")
+MAX_BYTES = 256 * 1024 * 1024
+MODEL_ID = "claude-wrapper"
+
+# Flipped off by `--no-llm-cache` (or SAYVDO_NO_LLM_CACHE=1)
+ENABLED = not os.environ.get("SAYVDO_NO_LLM_CACHE")
+
+_local = threading.local()
+_schema_lock = threading.Lock()
+_schema_ready = False
+
+
+def _conn() -> sqlite3.Connection:
+    global _schema_ready
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+        conn = sqlite3.connect(DB_PATH, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _local.conn = conn
+    if not _schema_ready:
+        with _schema_lock, conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    dimension TEXT NOT NULL,
+                    prompt_version INTEGER,
+                    model TEXT,
+                    size INTEGER NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS counters (
+                    name TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            _schema_ready = True
+    return conn
+
+
+def make_key(dimension: str, prompt_version: int, prompt: str, model: str = MODEL_ID) -> str:
+    digest = hashlib.sha256(prompt.encode()).hexdigest()
+    return hashlib.sha256(f"{dimension}\0{prompt_version}\0{model}\0{digest}".encode()).hexdigest()
+
+
+def _bump(conn: sqlite3.Connection, name: str):
+    conn.execute("""
+        INSERT INTO counters (name, value) VALUES (?, 1)
+        ON CONFLICT(name) DO UPDATE SET value = value + 1
+    """, (name,))
+
+
+def get(dimension: str, prompt_version: int, prompt: str, model: str = MODEL_ID) -> dict | None:
+    """Return the cached result for this prompt, or None on a miss."""
+    if not ENABLED:
+        return None
+    key = make_key(dimension, prompt_version, prompt, model)
+    try:
+        conn = _conn()
+        with conn:
+            row = conn.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                _bump(conn, "misses")
+                return None
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            _bump(conn, "hits")
+        return json.loads(row[0])
+    except (sqlite3.Error, ValueError):
+        return None  # The cache must never break scoring
+
+
+def put(dimension: str, prompt_version: int, prompt: str, result: dict, model: str = MODEL_ID):
+    """Store a successful model result and evict LRU entries past MAX_BYTES."""
+    if not ENABLED:
+        return
+    key = make_key(dimension, prompt_version, prompt, model)
+    value = json.dumps(result)
+    now = time.time()
+    try:
+        conn = _conn()
+        with conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO entries
+                    (key, dimension, prompt_version, model, size, value, created_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (key, dimension, prompt_version, model, len(value), value, now, now))
+            _evict(conn)
+    except sqlite3.Error:
+        pass
+
+
+def _evict(conn: sqlite3.Connection):
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    if total <= MAX_BYTES:
+        return
+    excess = total - MAX_BYTES
+    freed = 0
+    victims = []
+    for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+        victims.append((key,))
+        freed += size
+        if freed >= excess:
+            break
+    conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+    conn.execute("""
+        INSERT INTO counters (name, value) VALUES ('evictions', ?)
+        ON CONFLICT(name) DO UPDATE SET value = value + excluded.value
+    """, (len(victims),))
+
+
+def stats() -> dict:
+    """Hit/miss/eviction counters plus current size."""
+    conn = _conn()
+    counters = dict(conn.execute("SELECT name, value FROM counters").fetchall())
+    entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+    hits, misses = counters.get("hits", 0), counters.get("misses", 0)
+    return {
+        "entries": entries,
+        "bytes": size,
+        "max_bytes": MAX_BYTES,
+        "hits": hits,
+        "misses": misses,
+        "evictions": counters.get("evictions", 0),
+        "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+    }
+
+
+def clear():
+    conn = _conn()
+    with conn:
+        conn.execute("DELETE FROM entries")
+        conn.execute("DELETE FROM counters")
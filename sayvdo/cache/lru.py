@@ -0,0 +1,91 @@
+"""Bounded, thread-safe in-memory LRU cache with entry and byte limits.
+
+Entries can carry a tag (e.g. a ticker) so every entry derived from the
+same source can be dropped at once when that source is written. Readers
+that load from the source should take generation(tag) first and pass it to
+put(), so a value read before a concurrent write is not cached after it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float | None = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # key -> (value, size, tag, stored_at)
+        self._entries: OrderedDict = OrderedDict()
+        self._tags: dict = {}
+        self._generations: dict = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _drop(self, key):
+        _, size, tag, _ = self._entries.pop(key)
+        self._bytes -= size
+        if tag is not None:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def get(self, key):
+        """Cached value for key, or None (expired entries count as misses)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[3] > self.ttl:
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def generation(self, tag) -> int:
+        with self._lock:
+            return self._generations.get(tag, 0)
+
+    def put(self, key, value, size: int, tag=None, generation: int | None = None):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and self._generations.get(tag, 0) != generation:
+                return  # tag was invalidated while the caller was reading
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (value, size, tag, time.monotonic())
+            self._bytes += size
+            if tag is not None:
+                self._tags.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_tag(self, tag):
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            for key in list(self._tags.get(tag, ())):
+                self._drop(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            }
@@ -4,7 +4,9 @@ import argparse
 import json
 import sys
 
-from sayvdo.core import scorer, history
+from sayvdo import batch, export
+from sayvdo.cache import llm_cache
+from sayvdo.core import chunked, llm, scorer, history
 from sayvdo.worklog import log_scan
 
 WATCHLIST = ["NVDA", "MSFT", "AAPL", "AMZN", "GOOG", "META", "TSLA", "CRM", "IBM", "ORCL", "NFLX", "JPM"]
@@ -12,13 +14,15 @@ WATCHLIST = ["NVDA", "MSFT", "AAPL", "AMZN", "GOOG", "META", "TSLA", "CRM", "IBM
 BAR_CHARS = "█"
 
 
-def _bar(score: int, width: int = 20) -> str:
-    filled = round(score / 100 * width)
+def _bar(score: int | None, width: int = 20) -> str:
+    filled = round(score / 100 * width) if score is not None else 0
     return BAR_CHARS * filled + "░" * (width - filled)
 
 
-def _color(score: int) -> str:
-    if score >= 80:
+def _color(score: int | None) -> str:
+    if score is None:
+        return "\033[90m"  # grey
+    elif score >= 80:
         return "\033[92m"  # green
     elif score >= 60:
         return "\033[93m"  # yellow
@@ -44,7 +48,8 @@ def print_scorecard(result: dict):
     print(f"  SAY VS. DO — {company} ({ticker})")
     print(f"  {quarter}")
     print(f"{'='*60}")
-    print(f"\n  COMPOSITE SCORE: {c}{composite}/100{RESET}")
+    shown = f"{composite}/100" if composite is not None else "N/A"
+    print(f"\n  COMPOSITE SCORE: {c}{shown}{RESET}")
     print(f"  Verdict: {c}{verdict}{RESET}")
     print(f"\n  {_bar(composite)}\n")
 
@@ -58,12 +63,12 @@ def print_scorecard(result: dict):
 
     for key, label in dim_labels.items():
         dim = dims.get(key, {})
-        s = dim.get("score", "N/A")
+        s = dim.get("score")
         if isinstance(s, int):
             c2 = _color(s)
             print(f"  {label}: {c2}{s:>3}{RESET}  {_bar(s, 15)}")
         else:
-            print(f"  {label}: {s}")
+            print(f"  {label}: {'missing' if dim.get('missing') else 'N/A'}")
 
     print()
     # Print evidence + flags for each dimension
@@ -89,10 +94,13 @@ def print_scorecard(result: dict):
 def cmd_score(args):
     ticker = args.ticker.upper()
     quarter = getattr(args, "quarter", None)
-    result = scorer.run(ticker, quarter=quarter)
-    history.save_score(result)
-    log_scan(ticker, result["composite_score"], result["quarter"])
+    result = scorer.run(ticker, quarter=quarter, max_concurrency=args.concurrency)
+    if result["composite_score"] is not None:
+        history.save_score(result)
+        log_scan(ticker, result["composite_score"], result["quarter"])
     print_scorecard(result)
+    if result["composite_score"] is None:
+        print("  No dimension could be scored — result not saved.\n")
 
     if getattr(args, "json", False):
         print(json.dumps(result, indent=2))
@@ -100,14 +108,22 @@ def cmd_score(args):
 
 def cmd_watchlist(args):
     print(f"Running watchlist ({len(WATCHLIST)} companies)...")
-    for ticker in WATCHLIST:
-        try:
-            result = scorer.run(ticker)
-            history.save_score(result)
-            log_scan(ticker, result["composite_score"], result["quarter"])
-            print(f"  {ticker:6s} → {result['composite_score']:>3}/100  {result['verdict']}")
-        except Exception as e:
-            print(f"  {ticker:6s} → ERROR: {e}")
+    _run_batch(WATCHLIST, args)
+
+
+def cmd_batch(args):
+    tickers = batch.load_tickers(args.file)
+    print(f"Loaded {len(tickers)} tickers from {args.file}")
+    _run_batch(tickers, args)
+
+
+def _run_batch(tickers: list[str], args):
+    llm.set_concurrency(args.llm_concurrency)
+    try:
+        batch.run_batch(tickers, quarter=args.quarter, concurrency=args.concurrency,
+                        resume=not args.no_resume)
+    except KeyboardInterrupt:
+        sys.exit(130)
 
 
 def cmd_history(args):
@@ -121,13 +137,60 @@ def cmd_history(args):
     print(f"  {'Quarter':<12} {'Composite':>9} {'AI':>5} {'Guidance':>9} {'Risk':>6} {'Capital':>8} {'ESG':>5}")
     print(f"  {'-'*60}")
     for row in rows:
-        print(f"  {row['quarter']:<12} {row['composite_score']:>9} "
+        composite = row["composite_score"] if row["composite_score"] is not None else "—"
+        print(f"  {row['quarter']:<12} {composite:>9} "
               f"{row['ai_score'] or '?':>5} {row['guidance_score'] or '?':>9} "
               f"{row['risk_drift_score'] or '?':>6} {row['capital_score'] or '?':>8} "
               f"{row['esg_score'] or '?':>5}")
     print()
 
 
+def cmd_cache(args):
+    if args.clear:
+        llm_cache.clear()
+        print("LLM result cache cleared")
+        return
+    stats = llm_cache.stats()
+    print(f"\n  LLM result cache ({llm_cache.DB_PATH})")
+    print(f"  Entries:   {stats['entries']:,} ({stats['bytes'] / 1e6:.1f} / {stats['max_bytes'] / 1e6:.0f} MB)")
+    print(f"  Hits:      {stats['hits']:,}")
+    print(f"  Misses:    {stats['misses']:,}")
+    print(f"  Evictions: {stats['evictions']:,}")
+    if stats["hit_rate"] is not None:
+        print(f"  Hit rate:  {stats['hit_rate']:.1%}")
+    print()
+
+
+def cmd_export(args):
+    try:
+        fmt = args.format or (export.detect_format(args.output) if args.output else "ndjson")
+        count = export.export_scores(args.output, fmt, ticker=args.ticker, quarter=args.quarter,
+                                     since=args.since, until=args.until)
+    except (RuntimeError, ValueError) as e:
+        print(f"Export failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    if args.output:
+        print(f"Exported {count:,} rows to {args.output}")
+
+
+def cmd_import(args):
+    try:
+        fmt = args.format or export.detect_format(args.file)
+        count = export.import_scores(args.file, fmt)
+    except (RuntimeError, ValueError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Imported {count:,} rows from {args.file}")
+
+
+def cmd_llm_stub(args):
+    llm.STUB_LATENCY = args.latency
+    try:
+        llm.serve_stub(args.host, args.port)
+    except KeyboardInterrupt:
+        pass
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="sayvdo",
@@ -135,27 +198,96 @@ def main():
     )
     subparsers = parser.add_subparsers(dest="command")
 
+    scoring = argparse.ArgumentParser(add_help=False)
+    scoring.add_argument("--no-llm-cache", action="store_true",
+                         help="Always call the model, ignoring cached dimension results")
+    scoring.add_argument("--chunked", action="store_true",
+                         help="Analyze whole filings in parallel chunks instead of a truncated excerpt")
+    scoring.add_argument("--fused", action="store_true",
+                         help="Score the 10-K dimensions in one shared-context model call")
+    scoring.add_argument("--full", action="store_true",
+                         help="Rescore every dimension, even ones whose filings haven't changed")
+
     # score
-    p_score = subparsers.add_parser("score", help="Score a company")
+    p_score = subparsers.add_parser("score", parents=[scoring], help="Score a company")
     p_score.add_argument("ticker", help="Ticker symbol (e.g. MSFT)")
     p_score.add_argument("--quarter", help="Quarter (e.g. Q4-2025)", default=None)
     p_score.add_argument("--json", action="store_true", help="Output raw JSON")
+    p_score.add_argument("--concurrency", type=int, default=scorer.MAX_CONCURRENCY,
+                         help="Dimensions scored in parallel (default: all)")
+
+    batching = argparse.ArgumentParser(add_help=False)
+    batching.add_argument("--quarter", help="Quarter (e.g. Q4-2025)", default=None)
+    batching.add_argument("--concurrency", type=int, default=batch.DEFAULT_CONCURRENCY,
+                          help="Tickers scored at once")
+    batching.add_argument("--llm-concurrency", type=int, default=llm.CONCURRENCY,
+                          help="Model calls in flight across all tickers "
+                               "(default: SAYVDO_LLM_CONCURRENCY or 16)")
+    batching.add_argument("--no-resume", action="store_true",
+                          help="Rescore tickers already saved for the quarter")
 
     # watchlist
-    subparsers.add_parser("watchlist", help="Score all watchlist companies")
+    subparsers.add_parser("watchlist", parents=[scoring, batching], help="Score all watchlist companies")
+
+    # batch
+    p_batch = subparsers.add_parser("batch", parents=[scoring, batching],
+                                    help="Score every ticker listed in a file")
+    p_batch.add_argument("file", help="File of tickers (one per line or comma separated)")
 
     # history
     p_history = subparsers.add_parser("history", help="Show score history for a ticker")
     p_history.add_argument("ticker", help="Ticker symbol")
 
+    # cache
+    p_cache = subparsers.add_parser("cache", help="Show LLM result cache stats")
+    p_cache.add_argument("--clear", action="store_true", help="Delete all cached results")
+
+    # export / import
+    p_export = subparsers.add_parser("export", help="Bulk-export scores (NDJSON, CSV or Parquet)")
+    p_export.add_argument("-o", "--output", help="Output file (default: NDJSON/CSV to stdout)")
+    p_export.add_argument("--format", choices=export.FORMATS, help="Default: from the file extension")
+    p_export.add_argument("--ticker", help="Only this ticker")
+    p_export.add_argument("--quarter", help="Only this quarter (e.g. Q4-2025)")
+    p_export.add_argument("--since", help="Scanned on/after this date (YYYY-MM-DD)")
+    p_export.add_argument("--until", help="Scanned before this date (YYYY-MM-DD)")
+
+    p_import = subparsers.add_parser("import", help="Bulk-import scores from an export file")
+    p_import.add_argument("file", help="NDJSON, CSV or Parquet file")
+    p_import.add_argument("--format", choices=export.FORMATS, help="Default: from the file extension")
+
+    # llm-stub
+    p_stub = subparsers.add_parser("llm-stub", help="Serve canned model answers for offline load tests")
+    p_stub.add_argument("--host", default="127.0.0.1")
+    p_stub.add_argument("--port", type=int, default=8765)
+    p_stub.add_argument("--latency", type=float, default=llm.STUB_LATENCY,
+                        help="Seconds to wait before each answer")
+
     args = parser.parse_args()
+    if getattr(args, "no_llm_cache", False):
+        llm_cache.ENABLED = False
+    if getattr(args, "chunked", False):
+        chunked.ENABLED = True
+    if getattr(args, "fused", False):
+        scorer.FUSED = True
+    if getattr(args, "full", False):
+        scorer.INCREMENTAL = False
 
     if args.command == "score":
         cmd_score(args)
     elif args.command == "watchlist":
         cmd_watchlist(args)
+    elif args.command == "batch":
+        cmd_batch(args)
     elif args.command == "history":
         cmd_history(args)
+    elif args.command == "cache":
+        cmd_cache(args)
+    elif args.command == "export":
+        cmd_export(args)
+    elif args.command == "import":
+        cmd_import(args)
+    elif args.command == "llm-stub":
+        cmd_llm_stub(args)
     else:
         parser.print_help()
         sys.exit(1)
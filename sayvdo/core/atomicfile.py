@@ -0,0 +1,27 @@
+"""Atomic file writes for the on-disk caches.
+
+write() fills a temporary file next to the target and renames it into
+place, so readers in any thread or process see either the old file or the
+new one, never a partial write.
+"""
+
+import contextlib
+import os
+import threading
+
+
+@contextlib.contextmanager
+def write(path: str, mode: str = "w", opener=open, **kwargs):
+    """Open a temporary file for writing; it replaces `path` when the block exits cleanly.
+
+    `opener` is called as opener(tmp_path, mode, **kwargs), e.g. gzip.open.
+    """
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with opener(tmp, mode, **kwargs) as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp)
+        raise
@@ -0,0 +1,130 @@
+"""Map-reduce analysis over whole filings instead of a truncated head.
+
+Documents are split into chunks of about CHUNK_TOKENS on Item and
+paragraph boundaries. Each chunk gets a map call that pulls out the quotes
+and figures relevant to the dimension; map calls run in parallel, at most
+MAP_CONCURRENCY at a time across the process. A single reduce call then
+scores the dimension from the collected notes with the dimension's own
+PROMPT, so the result has the usual shape.
+
+Off by default (`sayvdo score --chunked` turns it on): a scan costs one
+model call per chunk plus the reduce. The map phase, including time queued
+for a map slot, is capped at MAP_BUDGET seconds; parts not extracted by
+then are marked as not analyzed and the reduce goes ahead without them.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from sayvdo.core import llm, sections
+
+ENABLED = False
+
+CHARS_PER_TOKEN = 4
+CHUNK_TOKENS = 12000
+MAP_CONCURRENCY = 8
+MAX_NOTES_CHARS = 40000  # collected notes passed to the reduce call
+MAP_BUDGET = 300         # seconds for all of a dimension's map calls
+
+MAP_PROMPT = """You are helping with the SEC filing analysis described between the markers below. Do not score anything yet.
+
+From the filing excerpt that follows, extract every direct quote, figure or fact relevant to that analysis. Keep quotes verbatim and short. If nothing in the excerpt is relevant, return an empty list.
+
+Return JSON only (no markdown):
+{{"notes": ["<quote, figure or fact>", ...]}}
+
+=== ANALYSIS ===
+{task}
+=== END ANALYSIS ===
+
+Excerpt ({label}):
+"""
+
+MAP_PROMPT_VERSION = 1
+
+_map_slots = threading.BoundedSemaphore(MAP_CONCURRENCY)
+
+
+def split(text: str, cuts: list[int], max_chars: int) -> list[str]:
+    """Split text into chunks of at most max_chars.
+
+    Chunks break between lines, and at a section start (one of `cuts`)
+    once they are at least half full; a single over-long line is split
+    where it must be.
+    """
+    cut_set = set(cuts)
+    chunks, current, size = [], [], 0
+    offset = 0
+    for line in text.split("\n"):
+        at_cut = offset in cut_set
+        offset += len(line) + 1
+        for piece in (line[i:i + max_chars] for i in range(0, len(line), max_chars)):
+            if current and (size + len(piece) > max_chars or (at_cut and size >= max_chars // 2)):
+                chunks.append("\n".join(current).strip())
+                current, size = [], 0
+            at_cut = False
+            current.append(piece)
+            size += len(piece) + 1
+    if current:
+        chunks.append("\n".join(current).strip())
+    return [chunk for chunk in chunks if chunk]
+
+
+def _chunks(documents: list[tuple[str, dict]]) -> list[tuple[str, str]]:
+    max_chars = CHUNK_TOKENS * CHARS_PER_TOKEN
+    labelled = []
+    for label, filing in documents:
+        text, found = sections.get_sections(filing)
+        parts = split(text, [start for start, _ in found.values()], max_chars)
+        labelled.extend((f"{label}, part {i} of {len(parts)}", part) for i, part in enumerate(parts, 1))
+    return labelled
+
+
+def _map(dimension: str, task: str, label: str, chunk: str, deadline: float) -> list[str] | None:
+    prompt = MAP_PROMPT.format(task=task.strip(), label=label) + chunk
+    if not _map_slots.acquire(timeout=max(0.0, deadline - time.monotonic())):
+        return None
+    try:
+        parsed = llm.ask(f"{dimension}.map", MAP_PROMPT_VERSION, prompt, required=("notes",))
+    finally:
+        _map_slots.release()
+    if not parsed or not isinstance(parsed["notes"], list):
+        return None
+    return [str(note) for note in parsed["notes"]]
+
+
+def analyze(dimension: str, prompt: str, prompt_version: int,
+            documents: list[tuple[str, dict]]) -> dict | None:
+    """Score `dimension` over every chunk of `documents` ((label, filing) pairs).
+
+    `prompt` is the dimension's PROMPT; the collected notes are appended to
+    it for the reduce call. The result is marked with mode "chunked".
+    Returns None if nothing could be extracted or the reduce call failed,
+    so the caller can fall back to its usual path.
+    """
+    chunks = _chunks(documents)
+    if not chunks:
+        return None
+
+    deadline = time.monotonic() + MAP_BUDGET
+    pool = ThreadPoolExecutor(max_workers=min(MAP_CONCURRENCY, len(chunks)))
+    futures = [pool.submit(_map, dimension, prompt, label, chunk, deadline) for label, chunk in chunks]
+    wait(futures, timeout=MAP_BUDGET)
+    # Map calls still running past the budget are abandoned, not waited for
+    pool.shutdown(wait=False, cancel_futures=True)
+    mapped = [f.result() if f.done() and not f.cancelled() and not f.exception() else None for f in futures]
+    if all(notes is None for notes in mapped):
+        return None
+
+    lines = [f"[Notes extracted from all {len(chunks)} parts of the filings, in document order]"]
+    for (label, _), notes in zip(chunks, mapped):
+        if notes is None:
+            lines.append(f"\n--- {label}: not analyzed ---")
+        elif notes:
+            lines.append(f"\n--- {label} ---")
+            lines.extend(f"- {note}" for note in notes)
+    reduce_prompt = prompt + "\n".join(lines)[:MAX_NOTES_CHARS]
+
+    result = llm.ask(dimension, prompt_version, reduce_prompt)
+    return {**result, "mode": "chunked"} if result else None
@@ -0,0 +1,13 @@
+"""Dimension scorers — each module's score(ticker, filing_data) returns one result dict."""
+
+
+def missing(dim_name: str, reason: str) -> dict:
+    """Result for a dimension that could not be scored; left out of the composite."""
+    return {
+        "dimension": dim_name,
+        "score": None,
+        "missing": True,
+        "evidence": [],
+        "flags": [reason],
+        "summary": f"{dim_name.replace('_', ' ').capitalize()} analysis unavailable.",
+    }
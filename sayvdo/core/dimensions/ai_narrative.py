@@ -4,8 +4,8 @@ Source: 10-K filing
 Measures: Does AI disclosure match public AI claims?
 """
 
-import json
-import subprocess
+from sayvdo.core import chunked, llm, sections
+from sayvdo.core.dimensions import missing
 
 
 PROMPT = """You are analyzing a 10-K SEC filing to score a company's AI narrative integrity.
@@ -29,44 +29,27 @@ Return JSON only (no markdown):
 Filing text (truncated):
 """
 
+PROMPT_VERSION = 1
+
 
 def score(ticker: str, filing_data: dict) -> dict:
     """Score AI narrative from 10-K text."""
     ten_k = filing_data.get("10k")
     if not ten_k or not ten_k.get("text"):
-        return {
-            "dimension": "ai_narrative",
-            "score": 0,
-            "evidence": [],
-            "flags": ["No 10-K filing available"],
-            "summary": "Could not fetch 10-K filing.",
-        }
+        return missing("ai_narrative", "No 10-K filing available")
+
+    if chunked.ENABLED:
+        result = chunked.analyze("ai_narrative", PROMPT, PROMPT_VERSION, [("10-K", ten_k)])
+        if result:
+            return result
 
-    text = ten_k["text"][:60000]
+    # Business and MD&A carry the AI claims; the head of the filing is
+    # mostly cover page and table of contents
+    text = sections.excerpt(ten_k, ("1", "7"), 60000) or ten_k["text"][:60000]
     prompt = PROMPT + text
 
-    try:
-        result = subprocess.run(
-            ["/Users/justinadair/bin/claude-wrapper", "-p", prompt],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-        raw = result.stdout.strip()
-        # Extract JSON from output
-        start = raw.find("{")
-        end = raw.rfind("}") + 1
-        if start >= 0 and end > start:
-            parsed = json.loads(raw[start:end])
-            if "dimension" in parsed and "score" in parsed:
-                return parsed
-    except Exception as e:
-        pass
+    result = llm.ask("ai_narrative", PROMPT_VERSION, prompt)
+    if result:
+        return result
 
-    return {
-        "dimension": "ai_narrative",
-        "score": 50,
-        "evidence": [],
-        "flags": [f"Claude analysis failed — defaulting to 50"],
-        "summary": "AI narrative analysis unavailable.",
-    }
+    return missing("ai_narrative", "Model analysis failed")
@@ -4,8 +4,8 @@ Source: 10-K + DEF 14A proxy statement
 Measures: Does actual R&D/capex spend match stated strategic priorities?
 """
 
-import json
-import subprocess
+from sayvdo.core import chunked, llm, sections
+from sayvdo.core.dimensions import missing
 
 
 PROMPT = """You are analyzing SEC filings to score whether a company's capital allocation matches its stated strategic priorities.
@@ -36,6 +36,8 @@ Return JSON only (no markdown):
 10-K filing excerpt:
 """
 
+PROMPT_VERSION = 1
+
 
 def score(ticker: str, filing_data: dict) -> dict:
     """Score capital allocation honesty from 10-K + DEF 14A."""
@@ -43,43 +45,25 @@ def score(ticker: str, filing_data: dict) -> dict:
     def14a = filing_data.get("def14a")
 
     if not ten_k or not ten_k.get("text"):
-        return {
-            "dimension": "capital_honesty",
-            "score": 0,
-            "evidence": [],
-            "flags": ["No 10-K filing available"],
-            "summary": "Could not fetch 10-K filing.",
-        }
+        return missing("capital_honesty", "No 10-K filing available")
+
+    if chunked.ENABLED:
+        documents = [("10-K", ten_k)] + ([("DEF 14A", def14a)] if def14a and def14a.get("text") else [])
+        result = chunked.analyze("capital_honesty", PROMPT, PROMPT_VERSION, documents)
+        if result:
+            return result
 
     # Combine 10-K financial section + proxy compensation data
-    combined = ten_k["text"][:40000]
+    # MD&A has the spend and liquidity discussion, Business the stated priorities
+    combined = sections.excerpt(ten_k, ("7", "1"), 40000) or ten_k["text"][:40000]
     if def14a and def14a.get("text"):
         combined += "\n\n--- PROXY STATEMENT (DEF 14A) ---\n"
-        combined += def14a["text"][:20000]
+        combined += sections.compensation_discussion(def14a, 20000) or def14a["text"][:20000]
 
     prompt = PROMPT + combined[:60000]
 
-    try:
-        result = subprocess.run(
-            ["/Users/justinadair/bin/claude-wrapper", "-p", prompt],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-        raw = result.stdout.strip()
-        start = raw.find("{")
-        end = raw.rfind("}") + 1
-        if start >= 0 and end > start:
-            parsed = json.loads(raw[start:end])
-            if "dimension" in parsed and "score" in parsed:
-                return parsed
-    except Exception as e:
-        pass
-
-    return {
-        "dimension": "capital_honesty",
-        "score": 50,
-        "evidence": [],
-        "flags": ["Claude analysis failed — defaulting to 50"],
-        "summary": "Capital allocation analysis unavailable.",
-    }
+    result = llm.ask("capital_honesty", PROMPT_VERSION, prompt)
+    if result:
+        return result
+
+    return missing("capital_honesty", "Model analysis failed")
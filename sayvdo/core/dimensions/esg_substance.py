@@ -4,8 +4,8 @@ Source: DEF 14A proxy statement
 Measures: Are ESG claims quantified or aspirational?
 """
 
-import json
-import subprocess
+from sayvdo.core import chunked, llm
+from sayvdo.core.dimensions import missing
 
 
 PROMPT = """You are analyzing a DEF 14A proxy statement to score the substantiveness of ESG disclosures.
@@ -44,43 +44,25 @@ Return JSON only (no markdown):
 DEF 14A proxy statement:
 """
 
+PROMPT_VERSION = 1
+
 
 def score(ticker: str, filing_data: dict) -> dict:
     """Score ESG substance from DEF 14A proxy statement."""
     def14a = filing_data.get("def14a")
 
     if not def14a or not def14a.get("text"):
-        return {
-            "dimension": "esg_substance",
-            "score": 30,
-            "evidence": [],
-            "flags": ["No DEF 14A proxy statement available — scoring conservatively"],
-            "summary": "No proxy statement found. Cannot assess ESG disclosure quality.",
-        }
+        return missing("esg_substance", "No DEF 14A proxy statement available")
+
+    if chunked.ENABLED:
+        result = chunked.analyze("esg_substance", PROMPT, PROMPT_VERSION, [("DEF 14A", def14a)])
+        if result:
+            return result
 
     prompt = PROMPT + def14a["text"][:60000]
 
-    try:
-        result = subprocess.run(
-            ["/Users/justinadair/bin/claude-wrapper", "-p", prompt],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-        raw = result.stdout.strip()
-        start = raw.find("{")
-        end = raw.rfind("}") + 1
-        if start >= 0 and end > start:
-            parsed = json.loads(raw[start:end])
-            if "dimension" in parsed and "score" in parsed:
-                return parsed
-    except Exception as e:
-        pass
-
-    return {
-        "dimension": "esg_substance",
-        "score": 50,
-        "evidence": [],
-        "flags": ["Claude analysis failed — defaulting to 50"],
-        "summary": "ESG substance analysis unavailable.",
-    }
+    result = llm.ask("esg_substance", PROMPT_VERSION, prompt)
+    if result:
+        return result
+
+    return missing("esg_substance", "Model analysis failed")
@@ -1,11 +1,11 @@
 """Guidance Accuracy Score.
 
-Source: 8-K earnings releases (quarterly)
+Source: 8-K earnings releases (quarterly, Item 2.02 EX-99.1 press releases)
 Measures: Compare EPS/revenue/margin guidance to actual results.
 """
 
-import json
-import subprocess
+from sayvdo.core import chunked, fetcher, llm
+from sayvdo.core.dimensions import missing
 
 
 PROMPT = """You are analyzing a series of 8-K earnings release filings to score a company's guidance accuracy.
@@ -35,48 +35,31 @@ Return JSON only (no markdown):
 8-K filings (most recent first):
 """
 
+PROMPT_VERSION = 1
+
 
 def score(ticker: str, filing_data: dict) -> dict:
     """Score guidance accuracy from 8-K filings."""
     eight_ks = filing_data.get("8ks", [])
     if not eight_ks:
-        return {
-            "dimension": "guidance_accuracy",
-            "score": 50,
-            "evidence": [],
-            "flags": ["No 8-K filings available"],
-            "summary": "Could not fetch 8-K earnings releases.",
-        }
-
-    # Combine up to 4 most recent 8-Ks
+        return missing("guidance_accuracy", "No earnings-release (Item 2.02) 8-Ks available")
+
+    if chunked.ENABLED:
+        documents = [(f"8-K {f['date']}", f) for f in eight_ks[:fetcher.EARNINGS_RELEASES]]
+        result = chunked.analyze("guidance_accuracy", PROMPT, PROMPT_VERSION, documents)
+        if result:
+            return result
+
+    # Combine the most recent earnings releases
     combined_text = ""
-    for i, filing in enumerate(eight_ks[:4]):
+    for i, filing in enumerate(eight_ks[:fetcher.EARNINGS_RELEASES]):
         combined_text += f"\n\n--- 8-K #{i+1} ({filing['date']}) ---\n"
         combined_text += filing["text"][:10000]
 
     prompt = PROMPT + combined_text[:50000]
 
-    try:
-        result = subprocess.run(
-            ["/Users/justinadair/bin/claude-wrapper", "-p", prompt],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-        raw = result.stdout.strip()
-        start = raw.find("{")
-        end = raw.rfind("}") + 1
-        if start >= 0 and end > start:
-            parsed = json.loads(raw[start:end])
-            if "dimension" in parsed and "score" in parsed:
-                return parsed
-    except Exception as e:
-        pass
-
-    return {
-        "dimension": "guidance_accuracy",
-        "score": 50,
-        "evidence": [],
-        "flags": ["Claude analysis failed — defaulting to 50"],
-        "summary": "Guidance accuracy analysis unavailable.",
-    }
+    result = llm.ask("guidance_accuracy", PROMPT_VERSION, prompt)
+    if result:
+        return result
+
+    return missing("guidance_accuracy", "Model analysis failed")
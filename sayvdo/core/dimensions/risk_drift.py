@@ -2,11 +2,16 @@
 
 Source: 10-K Risk Factors section, YoY comparison
 Measures: What risks quietly appeared or disappeared between filings?
+
+Item 1A is diffed locally against the prior year's 10-K (see riskdiff) and
+only the added, removed and reworded risks go to the model. An unchanged
+section keeps the last stored score without a model call.
 """
 
 import json
-import re
-import subprocess
+
+from sayvdo.core import fetcher, history, llm, riskdiff, sections
+from sayvdo.core.dimensions import missing
 
 
 PROMPT = """You are analyzing a 10-K SEC filing's Risk Factors section to score a company's risk disclosure transparency.
@@ -37,58 +42,112 @@ Return JSON only (no markdown):
 10-K filing (focus on Risk Factors section):
 """
 
+PROMPT_VERSION = 1
 
-def _extract_risk_section(text: str) -> str:
-    """Try to extract just the Risk Factors section."""
-    # Look for common Risk Factors headers
-    patterns = [
-        r"(?i)ITEM\s+1A[\.\s]+RISK FACTORS(.*?)(?=ITEM\s+1B|ITEM\s+2)",
-        r"(?i)Risk Factors(.*?)(?=Item\s+2|PART\s+II)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.DOTALL)
-        if match:
-            return match.group(1)[:30000]
-    # Return first 40k chars as fallback
-    return text[:40000]
 
+DIFF_PROMPT = """You are analyzing how a company's 10-K Risk Factors section changed since the prior year's 10-K, to score its risk disclosure transparency.
 
-def score(ticker: str, filing_data: dict) -> dict:
-    """Score risk language drift from 10-K."""
-    ten_k = filing_data.get("10k")
-    if not ten_k or not ten_k.get("text"):
+Below are only the risk factors that were added, removed or reworded; unchanged ones are omitted.
+
+Look for:
+- New risks that appeared (added language about AI dependency, regulatory risk, concentration risk, etc.)
+- Risks that quietly disappeared or were softened while the underlying exposure likely remains
+- Specificity changes: did reworded risks become more specific or more vague?
+- Boilerplate vs substance in the new language
+- Hidden or minimized risks: material changes buried in minor rewording
+
+Score 0-100 where:
+- 90-100: Changes are specific and forthcoming — nothing material removed or softened
+- 70-89: Good updates with minor gaps
+- 50-69: Mix of substantive and boilerplate changes, some questionable removals
+- 30-49: Mostly boilerplate changes, important risks softened or dropped
+- 0-29: Changes appear designed to minimize rather than disclose
+
+Return JSON only (no markdown):
+{
+  "dimension": "risk_drift",
+  "score": <0-100 integer>,
+  "evidence": ["<direct quote from the changes>", ...],
+  "flags": ["<concern or removed/softened risk>", ...],
+  "summary": "<1-2 sentence summary>"
+}
+
+Risk Factors changes since the prior 10-K:
+"""
+
+DIFF_PROMPT_VERSION = 1
+
+# Results saved before failed dimensions were marked missing defaulted to
+# 50 and say so in their flags
+_FALLBACK_MARKER = "defaulting to"
+
+
+def _extract_risk_section(ten_k: dict) -> str:
+    """Item 1A (Risk Factors), or the head of the filing if it can't be found."""
+    risk_text = sections.excerpt(ten_k, ("1A",), 30000)
+    return risk_text if risk_text is not None else fetcher.full_text(ten_k)[:40000]
+
+
+def _previous_result(ticker: str) -> dict | None:
+    """Last stored risk_drift result for the ticker, unless it was a fallback."""
+    latest = history.get_latest(ticker)
+    if not latest:
+        return None
+    previous = json.loads(latest["scores_json"]).get("dimensions", {}).get("risk_drift")
+    if not previous or previous.get("score") is None:
+        return None
+    if any(_FALLBACK_MARKER in flag for flag in previous.get("flags", [])):
+        return None
+    return previous
+
+
+def _score_diff(ticker: str, ten_k: dict, prior: dict) -> dict | None:
+    """Score from the YoY diff; None when the full-section path should run."""
+    current_1a = sections.section(ten_k, "1A")
+    prior_1a = sections.section(prior, "1A")
+    if not current_1a or not prior_1a:
+        return None
+
+    changes = riskdiff.diff(prior_1a, current_1a)
+    if not changes["total"]:
+        return None
+    print(f"  [{ticker}] risk_drift: {len(changes['added'])} new, {len(changes['changed'])} reworded, "
+          f"{len(changes['removed'])} removed, {changes['unchanged']} unchanged vs {prior['date']}")
+
+    if not riskdiff.has_changes(changes):
+        # Same disclosure as last year: the score still holds, but the
+        # quotes and flags were about changes that aren't in this filing
+        previous = _previous_result(ticker)
+        if previous is None:
+            return None
         return {
             "dimension": "risk_drift",
-            "score": 0,
+            "score": previous["score"],
             "evidence": [],
-            "flags": ["No 10-K filing available"],
-            "summary": "Could not fetch 10-K filing.",
+            "flags": [],
+            "summary": f"Risk Factors unchanged since the {prior['date']} 10-K; "
+                       f"score carried over from the last scan.",
         }
 
-    risk_text = _extract_risk_section(ten_k["text"])
-    prompt = PROMPT + risk_text
-
-    try:
-        result = subprocess.run(
-            ["/Users/justinadair/bin/claude-wrapper", "-p", prompt],
-            capture_output=True,
-            text=True,
-            timeout=120,
-        )
-        raw = result.stdout.strip()
-        start = raw.find("{")
-        end = raw.rfind("}") + 1
-        if start >= 0 and end > start:
-            parsed = json.loads(raw[start:end])
-            if "dimension" in parsed and "score" in parsed:
-                return parsed
-    except Exception as e:
-        pass
-
-    return {
-        "dimension": "risk_drift",
-        "score": 50,
-        "evidence": [],
-        "flags": ["Claude analysis failed — defaulting to 50"],
-        "summary": "Risk drift analysis unavailable.",
-    }
+    return llm.ask("risk_drift", DIFF_PROMPT_VERSION, DIFF_PROMPT + riskdiff.render(changes))
+
+
+def score(ticker: str, filing_data: dict) -> dict:
+    """Score risk language drift from the 10-K, diffed against the prior year's."""
+    ten_k = filing_data.get("10k")
+    if not ten_k or not ten_k.get("text"):
+        return missing("risk_drift", "No 10-K filing available")
+
+    prior = filing_data.get("10k_prior")
+    if prior:
+        result = _score_diff(ticker, ten_k, prior)
+        if result:
+            return result
+
+    # No usable prior year: score the section on its own. The Risk Factors
+    # section often starts past the truncated 10-K text
+    result = llm.ask("risk_drift", PROMPT_VERSION, PROMPT + _extract_risk_section(ten_k))
+    if result:
+        return result
+
+    return missing("risk_drift", "Model analysis failed")
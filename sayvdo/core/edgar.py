@@ -0,0 +1,49 @@
+"""EDGAR HTTP access shared by the fetcher, filing index and ticker directory.
+
+Every request to sec.gov goes through get(): one pooled keep-alive session
+for the process, paced by one rate limiter shared with every other sayvdo
+process on the machine.
+"""
+
+import os
+
+import requests
+
+from sayvdo.core import ratelimit
+
+HEADERS = {
+    "User-Agent": "SayVsDo/1.0 (research@example.com)",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+CACHE_DIR = os.path.expanduser("~/.sayvdo_cache")
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+# SEC's published ceiling, shared by every thread and process on this machine
+EDGAR_RATE = 10
+# Keep-alive connections kept open per EDGAR host, across all threads
+POOL_SIZE = 32
+
+_limiter = ratelimit.TokenBucket(EDGAR_RATE, state_path=os.path.join(CACHE_DIR, "edgar_rate.state"))
+
+# One session for the process: worker pools are created per scan, so
+# per-thread sessions would reconnect to EDGAR on every scan
+_session = requests.Session()
+_session.headers.update(HEADERS)
+_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=POOL_SIZE))
+
+
+def get(url: str, timeout: int = 30, headers: dict | None = None) -> requests.Response:
+    _limiter.acquire()
+    return _session.get(url, headers=headers, timeout=timeout)
+
+
+def get_json(url: str) -> dict:
+    resp = get(url)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def get_submissions(cik: str) -> dict:
+    padded = cik.zfill(10)
+    return get_json(f"https://data.sec.gov/submissions/CIK{padded}.json")
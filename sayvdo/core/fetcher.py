@@ -1,219 +1,328 @@
 """EDGAR fetcher for Say vs. Do — extends sec-scanner pattern.
 
-Fetches: 10-K, 8-K (earnings releases), DEF 14A (proxy statements).
+Fetches: 10-K (latest and prior year), 8-K (earnings releases), DEF 14A (proxy statements).
 """
 
 import os
-import re
-import time
+import datetime
+import gzip
 import hashlib
-import warnings
+import re
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
 
-warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
-
-HEADERS = {
-    "User-Agent": "SayVsDo/1.0 (research@example.com)",
-    "Accept-Encoding": "gzip, deflate",
-}
+from sayvdo.core import atomicfile, edgar, extract, filings, singleflight, tickers
 
-CACHE_DIR = os.path.expanduser("~/.sayvdo_cache")
-os.makedirs(CACHE_DIR, exist_ok=True)
+MAX_WORKERS = 8
 
-_last_request_time = 0.0
+# Earnings-release 8-Ks fetched per ticker — as many as guidance_accuracy reads
+EARNINGS_RELEASES = 4
 
+# How far back the form selectors search. Without a bound, a form the
+# company never filed (or filed fewer times than asked) pages through its
+# whole submissions history on every scan.
+LOOKBACK_DAYS = 3 * 365
 
-def _throttle():
-    global _last_request_time
-    elapsed = time.time() - _last_request_time
-    if elapsed < 0.15:
-        time.sleep(0.15 - elapsed)
-    _last_request_time = time.time()
+_downloads = singleflight.Group()
 
 
 def _cache_key(url: str) -> str:
     return hashlib.md5(url.encode()).hexdigest()
 
 
+def _cache_path(url: str) -> str:
+    # Full cleaned documents, gzip-compressed. Pre-existing .txt entries were
+    # truncated at write time and are ignored.
+    return os.path.join(edgar.CACHE_DIR, _cache_key(url) + ".txt.gz")
+
+
 def _cache_get(url: str) -> str | None:
-    path = os.path.join(CACHE_DIR, _cache_key(url) + ".txt")
-    if os.path.exists(path):
-        with open(path) as f:
+    try:
+        with gzip.open(_cache_path(url), "rt", encoding="utf-8") as f:
             return f.read()
-    return None
+    except (OSError, EOFError):
+        return None
 
 
 def _cache_set(url: str, text: str):
-    path = os.path.join(CACHE_DIR, _cache_key(url) + ".txt")
-    with open(path, "w") as f:
+    with atomicfile.write(_cache_path(url), "wt", opener=gzip.open, encoding="utf-8", compresslevel=6) as f:
         f.write(text)
 
 
 def get_cik(ticker: str) -> str | None:
     """Look up CIK number for a ticker symbol."""
-    _throttle()
-    url = "https://www.sec.gov/files/company_tickers.json"
-    resp = requests.get(url, headers=HEADERS, timeout=30)
-    resp.raise_for_status()
-    for entry in resp.json().values():
-        if entry.get("ticker", "").upper() == ticker.upper():
-            return str(entry["cik_str"])
-    return None
+    entry = tickers.lookup(ticker)
+    return entry["cik"] if entry else None
 
 
 def get_company_name(ticker: str) -> str:
-    _throttle()
-    url = "https://www.sec.gov/files/company_tickers.json"
-    resp = requests.get(url, headers=HEADERS, timeout=30)
-    resp.raise_for_status()
-    for entry in resp.json().values():
-        if entry.get("ticker", "").upper() == ticker.upper():
-            return entry.get("title", ticker)
-    return ticker
+    entry = tickers.lookup(ticker)
+    return entry["title"] if entry else ticker
 
 
-def _get_submissions(cik: str) -> dict:
-    _throttle()
-    padded = cik.zfill(10)
-    url = f"https://data.sec.gov/submissions/CIK{padded}.json"
-    resp = requests.get(url, headers=HEADERS, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+def _resolve(ticker: str, index: filings.FilingIndex | None) -> tuple[str | None, filings.FilingIndex | None]:
+    """Return (company, index) for a ticker, fetching the index if not given."""
+    entry = tickers.lookup(ticker)
+    if not entry:
+        return None, None
+    return entry["title"], index or filings.get_index(entry["cik"])
 
 
-def download_and_clean(url: str, max_chars: int = 80000) -> str:
-    """Download an EDGAR filing and return clean text."""
+def load_document(url: str) -> str:
+    """Full cleaned text of an EDGAR document, downloaded at most once.
+
+    Concurrent calls for the same document share a single download.
+    """
+    return _downloads.do(url, _load_document, url)
+
+
+def _load_document(url: str) -> str:
     cached = _cache_get(url)
-    if cached:
+    if cached is not None:
         return cached
 
-    _throttle()
-    resp = requests.get(url, headers=HEADERS, timeout=60)
+    resp = edgar.get(url, timeout=60)
     resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-    for tag in soup.find_all(["script", "style", "ix:nonfraction", "ix:nonnumeric",
-                               "ix:header", "ix:hidden", "ix:references"]):
-        tag.decompose()
+    text = extract.extract_text(resp.text)
+    _cache_set(url, text)
+    return text
 
-    text = soup.get_text(separator="\n")
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    text = "\n".join(lines)
-    text = re.sub(r"[_=\-]{10,}", "", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
 
-    if len(text) > max_chars:
-        text = text[:max_chars]
+def download_and_clean(url: str, max_chars: int = 80000) -> str:
+    """Download an EDGAR filing and return clean text, truncated to max_chars.
+
+    The cache holds the whole document, so any truncation can be served
+    later without re-downloading.
+    """
+    text = load_document(url)
+    return text[:max_chars] if max_chars else text
 
-    _cache_set(url, text)
-    return text
 
+def full_text(filing: dict) -> str:
+    """Untruncated text for a filing dict returned by the fetch_* functions."""
+    if filing.get("url"):
+        try:
+            return load_document(filing["url"])
+        except requests.RequestException:
+            pass
+    return filing.get("text", "")
+
+
+def _since(days: int = LOOKBACK_DAYS, before: str | None = None) -> str:
+    end = datetime.date.fromisoformat(before) if before else datetime.date.today()
+    return (end - datetime.timedelta(days=days)).isoformat()
+
+
+def _select_10k(index: filings.FilingIndex) -> dict | None:
+    found = index.find(("10-K", "10-K/A"), limit=1, since=_since())
+    return found[0] if found else None
+
+
+def _select_prior_10k(index: filings.FilingIndex) -> dict | None:
+    latest = _select_10k(index)
+    if not latest:
+        return None
+    # Skip amendments and anything filed within the same fiscal year
+    cutoff = _since(300, before=latest["date"])
+    found = index.find("10-K", limit=3, since=_since(2 * 365, before=latest["date"]))
+    return next((f for f in found if f["date"] <= cutoff), None)
 
-def fetch_10k(ticker: str) -> dict | None:
+
+def _select_8ks(index: filings.FilingIndex, max_count: int = EARNINGS_RELEASES) -> list[dict]:
+    # Item 2.02 (Results of Operations) 8-Ks carry the earnings release;
+    # director changes, bylaws etc. say nothing about guidance, so without
+    # any guidance_accuracy is reported missing rather than scored on them
+    return index.find("8-K", limit=max_count, since=_since(), item="2.02")
+
+
+def _select_def14a(index: filings.FilingIndex) -> dict | None:
+    found = index.find("DEF 14A", limit=1, since=_since())
+    return found[0] if found else None
+
+
+def current_accessions(ticker: str, index: filings.FilingIndex | None = None) -> dict[str, list[str]] | None:
+    """Accession numbers fetch_all_filings would use right now, by input key.
+
+    Costs at most the submissions fetch — nothing is downloaded.
+    """
+    _, index = _resolve(ticker, index)
+    if not index:
+        return None
+    singles = {
+        "10k": _select_10k(index),
+        "10k_prior": _select_prior_10k(index),
+        "def14a": _select_def14a(index),
+    }
+    accessions = {key: [f["accession"]] if f else [] for key, f in singles.items()}
+    accessions["8ks"] = [f["accession"] for f in _select_8ks(index)]
+    return accessions
+
+
+def fetch_10k(ticker: str, index: filings.FilingIndex | None = None) -> dict | None:
     """Fetch latest 10-K for ticker. Returns dict or None."""
     print(f"  [{ticker}] Fetching 10-K...")
-    cik = get_cik(ticker)
-    if not cik:
+    company, index = _resolve(ticker, index)
+    if not index:
         print(f"  [{ticker}] ERROR: CIK not found")
         return None
 
-    company = get_company_name(ticker)
-    data = _get_submissions(cik)
-    recent = data.get("filings", {}).get("recent", {})
-    forms = recent.get("form", [])
-    accessions = recent.get("accessionNumber", [])
-    dates = recent.get("filingDate", [])
-    primary_docs = recent.get("primaryDocument", [])
-
-    for i, form in enumerate(forms):
-        if form in ("10-K", "10-K/A"):
-            accession = accessions[i].replace("-", "")
-            doc = primary_docs[i]
-            date = dates[i]
-            url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{doc}"
-            print(f"  [{ticker}] Downloading 10-K from {date}...")
-            text = download_and_clean(url)
-            print(f"  [{ticker}] 10-K: {len(text):,} chars")
-            return {"ticker": ticker.upper(), "company": company, "date": date, "text": text, "url": url, "form": "10-K"}
-
-    print(f"  [{ticker}] ERROR: No 10-K found")
-    return None
-
-
-def fetch_8k_list(ticker: str, max_count: int = 8) -> list[dict]:
-    """Fetch last N 8-K filings for ticker. Returns list of dicts."""
+    filing = _select_10k(index)
+    if not filing:
+        print(f"  [{ticker}] ERROR: No 10-K found")
+        return None
+
+    url, date = filing["url"], filing["date"]
+    print(f"  [{ticker}] Downloading 10-K from {date}...")
+    text = download_and_clean(url)
+    print(f"  [{ticker}] 10-K: {len(text):,} chars")
+    return {"ticker": ticker.upper(), "company": company, "date": date, "text": text, "url": url,
+            "form": "10-K", "accession": filing["accession"]}
+
+
+def fetch_prior_10k(ticker: str, index: filings.FilingIndex | None = None) -> dict | None:
+    """Fetch the 10-K filed a year before the latest one, for YoY comparison."""
+    company, index = _resolve(ticker, index)
+    if not index:
+        return None
+
+    prior = _select_prior_10k(index)
+    if not prior:
+        print(f"  [{ticker}] No prior-year 10-K found")
+        return None
+
+    url, date = prior["url"], prior["date"]
+    print(f"  [{ticker}] Downloading prior 10-K from {date}...")
+    text = download_and_clean(url)
+    return {"ticker": ticker.upper(), "company": company, "date": date, "text": text, "url": url,
+            "form": "10-K", "accession": prior["accession"]}
+
+
+def _exhibit_cache_path(accession: str) -> str:
+    return os.path.join(edgar.CACHE_DIR, _cache_key(accession) + ".exhibit")
+
+
+def _find_exhibit(index_html: str, prefix: str = "EX-99") -> str | None:
+    """Href of the best EX-99.x document in an EDGAR filing index page."""
+    found = {}
+    for row in re.findall(r"<tr[^>]*>(.*?)</tr>", index_html, re.I | re.S):
+        cells = [re.sub(r"<[^>]+>|\s+", " ", c).strip() for c in re.findall(r"<td[^>]*>(.*?)</td>", row, re.I | re.S)]
+        href = re.search(r'href="([^"]+)"', row, re.I)
+        # Type is the last column; descriptions may mention exhibits too
+        doc_type = next((c.upper() for c in reversed(cells) if c.upper().startswith(prefix)), None)
+        if href and doc_type and doc_type not in found:
+            found[doc_type] = href.group(1).replace("/ix?doc=", "")
+    for doc_type in (f"{prefix}.1", f"{prefix}.01", prefix):
+        if doc_type in found:
+            return found[doc_type]
+    return next(iter(found.values()), None)
+
+
+def earnings_release_url(filing: dict) -> str:
+    """URL of an 8-K's EX-99.1 press release, or its primary document if none.
+
+    Resolved from the filing's -index.htm page once per accession; filings
+    never change, so the answer is cached for good.
+    """
+    path = _exhibit_cache_path(filing["accession"])
+    try:
+        with open(path) as f:
+            return f.read().strip() or filing["url"]
+    except OSError:
+        pass
+
+    folder = filing["url"].rsplit("/", 1)[0]
+    resp = edgar.get(f"{folder}/{filing['accession']}-index.htm")
+    if resp.status_code != 200:
+        return filing["url"]
+    href = _find_exhibit(resp.text)
+    url = "https://www.sec.gov" + href if href and href.startswith("/") else (href or "")
+    with atomicfile.write(path) as f:
+        f.write(url)
+    return url or filing["url"]
+
+
+def _load_earnings_release(filing: dict) -> tuple[str, str]:
+    try:
+        url = earnings_release_url(filing)
+    except requests.RequestException:
+        url = filing["url"]
+    return url, download_and_clean(url, max_chars=40000)
+
+
+def fetch_8k_list(ticker: str, max_count: int = EARNINGS_RELEASES,
+                  index: filings.FilingIndex | None = None) -> list[dict]:
+    """Fetch the last N earnings-release 8-Ks (Item 2.02) for ticker."""
     print(f"  [{ticker}] Fetching 8-Ks...")
-    cik = get_cik(ticker)
-    if not cik:
+    company, index = _resolve(ticker, index)
+    if not index:
         return []
 
-    company = get_company_name(ticker)
-    data = _get_submissions(cik)
-    recent = data.get("filings", {}).get("recent", {})
-    forms = recent.get("form", [])
-    accessions = recent.get("accessionNumber", [])
-    dates = recent.get("filingDate", [])
-    primary_docs = recent.get("primaryDocument", [])
-
-    results = []
-    for i, form in enumerate(forms):
-        if form == "8-K" and len(results) < max_count:
-            accession = accessions[i].replace("-", "")
-            doc = primary_docs[i]
-            date = dates[i]
-            url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{doc}"
-            print(f"  [{ticker}] Downloading 8-K from {date}...")
-            text = download_and_clean(url, max_chars=40000)
-            results.append({
-                "ticker": ticker.upper(),
-                "company": company,
-                "date": date,
-                "text": text,
-                "url": url,
-                "form": "8-K",
-            })
+    found = _select_8ks(index, max_count)
+    for filing in found:
+        print(f"  [{ticker}] Downloading 8-K from {filing['date']}...")
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        loaded = list(pool.map(_load_earnings_release, found))
+
+    results = [
+        {
+            "ticker": ticker.upper(),
+            "company": company,
+            "date": filing["date"],
+            "text": text,
+            "url": url,
+            "form": "8-K",
+            "accession": filing["accession"],
+        }
+        for filing, (url, text) in zip(found, loaded)
+    ]
 
     print(f"  [{ticker}] Got {len(results)} 8-Ks")
     return results
 
 
-def fetch_def14a(ticker: str) -> dict | None:
+def fetch_def14a(ticker: str, index: filings.FilingIndex | None = None) -> dict | None:
     """Fetch latest DEF 14A (proxy statement) for ticker."""
     print(f"  [{ticker}] Fetching DEF 14A (proxy)...")
-    cik = get_cik(ticker)
-    if not cik:
+    company, index = _resolve(ticker, index)
+    if not index:
         return None
 
-    company = get_company_name(ticker)
-    data = _get_submissions(cik)
-    recent = data.get("filings", {}).get("recent", {})
-    forms = recent.get("form", [])
-    accessions = recent.get("accessionNumber", [])
-    dates = recent.get("filingDate", [])
-    primary_docs = recent.get("primaryDocument", [])
-
-    for i, form in enumerate(forms):
-        if form == "DEF 14A":
-            accession = accessions[i].replace("-", "")
-            doc = primary_docs[i]
-            date = dates[i]
-            url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession}/{doc}"
-            print(f"  [{ticker}] Downloading DEF 14A from {date}...")
-            text = download_and_clean(url, max_chars=60000)
-            print(f"  [{ticker}] DEF 14A: {len(text):,} chars")
-            return {"ticker": ticker.upper(), "company": company, "date": date, "text": text, "url": url, "form": "DEF 14A"}
-
-    print(f"  [{ticker}] No DEF 14A found")
-    return None
-
-
-def fetch_all_filings(ticker: str) -> dict:
-    """Fetch all filing types needed for full scoring."""
-    return {
-        "ticker": ticker.upper(),
-        "10k": fetch_10k(ticker),
-        "8ks": fetch_8k_list(ticker),
-        "def14a": fetch_def14a(ticker),
-    }
+    filing = _select_def14a(index)
+    if not filing:
+        print(f"  [{ticker}] No DEF 14A found")
+        return None
+
+    url, date = filing["url"], filing["date"]
+    print(f"  [{ticker}] Downloading DEF 14A from {date}...")
+    text = download_and_clean(url, max_chars=60000)
+    print(f"  [{ticker}] DEF 14A: {len(text):,} chars")
+    return {"ticker": ticker.upper(), "company": company, "date": date, "text": text, "url": url,
+            "form": "DEF 14A", "accession": filing["accession"]}
+
+
+FETCHERS = {
+    "10k": fetch_10k,
+    "10k_prior": fetch_prior_10k,
+    "8ks": fetch_8k_list,
+    "def14a": fetch_def14a,
+}
+
+
+def fetch_all_filings(ticker: str, inputs: tuple[str, ...] | None = None) -> dict:
+    """Fetch all filing types needed for full scoring.
+
+    `inputs` limits the fetch to some FETCHERS keys; the others come back
+    empty (None, or [] for 8ks).
+    """
+    inputs = tuple(FETCHERS) if inputs is None else inputs
+    # One submissions fetch shared by every form selector below; the
+    # selectors (and the 8-K downloads inside fetch_8k_list) run concurrently
+    _, index = _resolve(ticker, None)
+    data = {"ticker": ticker.upper(), "10k": None, "10k_prior": None, "8ks": [], "def14a": None}
+    with ThreadPoolExecutor(max_workers=max(1, len(inputs))) as pool:
+        futures = {key: pool.submit(FETCHERS[key], ticker, index=index) for key in inputs}
+        for key, future in futures.items():
+            data[key] = future.result()
+    return data
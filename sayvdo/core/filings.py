@@ -0,0 +1,121 @@
+"""Per-ticker filing index — one submissions fetch shared by all form selectors.
+
+The EDGAR submissions JSON is already column-oriented (parallel arrays of
+form, date, accession, ...). FilingIndex keeps it that way and only follows
+the paginated `filings.files` history pages when a search runs past the
+`recent` block, so most lookups cost a single round-trip.
+"""
+
+import threading
+import time
+
+from sayvdo.core import edgar
+
+COLUMNS = ("form", "filingDate", "reportDate", "accessionNumber", "primaryDocument", "items")
+INDEX_TTL_SECONDS = 300
+
+_lock = threading.Lock()
+_cache: dict[str, tuple[float, "FilingIndex"]] = {}
+
+
+class FilingIndex:
+    """Column-oriented view over every filing a company has made."""
+
+    def __init__(self, cik: str, submissions: dict):
+        self.cik = str(int(cik))
+        filings = submissions.get("filings", {})
+        recent = filings.get("recent", {})
+        self.columns = {col: list(recent.get(col, [])) for col in COLUMNS}
+        self._size = len(self.columns["form"])
+        self._pad()
+        # Older history pages, newest first; fetched on demand
+        self._pages = sorted(
+            filings.get("files", []),
+            key=lambda f: f.get("filingTo", ""),
+            reverse=True,
+        )
+        self._page_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _pad(self):
+        for col in COLUMNS:
+            values = self.columns[col]
+            if len(values) < self._size:
+                values.extend([""] * (self._size - len(values)))
+
+    def _load_next_page(self, seen: int, since: str | None = None) -> bool:
+        """Make rows past `seen` available, loading the next history page if
+        needed. False when there are none left, or the next page ends before
+        `since`."""
+        with self._page_lock:
+            if self._size > seen:
+                return True  # another search loaded a page meanwhile
+            if not self._pages:
+                return False
+            if since and self._pages[0].get("filingTo", since) < since:
+                return False  # kept for a later search reaching further back
+            page = self._pages.pop(0)
+            data = edgar.get_json(f"https://data.sec.gov/submissions/{page['name']}")
+            for col in COLUMNS:
+                self.columns[col].extend(data.get(col, []))
+            self._size += len(data.get("form", []))
+            self._pad()
+            return True
+
+    def row(self, i: int) -> dict:
+        accession = self.columns["accessionNumber"][i]
+        doc = self.columns["primaryDocument"][i]
+        return {
+            "form": self.columns["form"][i],
+            "date": self.columns["filingDate"][i],
+            "report_date": self.columns["reportDate"][i],
+            "accession": accession,
+            "primary_doc": doc,
+            "items": self.columns["items"][i],
+            "url": f"https://www.sec.gov/Archives/edgar/data/{self.cik}/{accession.replace('-', '')}/{doc}",
+        }
+
+    def find(self, forms: str | tuple[str, ...], limit: int | None = None,
+             since: str | None = None, item: str | None = None) -> list[dict]:
+        """Filings matching `forms`, newest first.
+
+        `item` keeps only filings reporting that 8-K item code (e.g. "2.02").
+        History pages are pulled in only if the loaded rows run out before
+        `limit` matches are found or the `since` date (YYYY-MM-DD) is reached.
+        """
+        if isinstance(forms, str):
+            forms = (forms,)
+        results = []
+        i = 0
+        while True:
+            form_col = self.columns["form"]
+            date_col = self.columns["filingDate"]
+            items_col = self.columns["items"]
+            while i < self._size:
+                if since and date_col[i] and date_col[i] < since:
+                    return results
+                if form_col[i] in forms and (item is None or item in items_col[i].split(",")):
+                    results.append(self.row(i))
+                    if limit is not None and len(results) >= limit:
+                        return results
+                i += 1
+            if not self._load_next_page(i, since):
+                return results
+
+
+def get_index(cik: str) -> FilingIndex:
+    """Return the filing index for a CIK, reusing one fetched in the last few minutes."""
+    key = str(int(cik))
+    with _lock:
+        hit = _cache.get(key)
+        if hit and time.time() - hit[0] < INDEX_TTL_SECONDS:
+            return hit[1]
+
+    index = FilingIndex(key, edgar.get_submissions(key))
+    with _lock:
+        _cache[key] = (time.time(), index)
+        for stale in [k for k, (t, _) in _cache.items() if time.time() - t >= INDEX_TTL_SECONDS]:
+            del _cache[stale]
+    return index
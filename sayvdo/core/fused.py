@@ -0,0 +1,104 @@
+"""Fused scoring — the 10-K dimensions from one model call.
+
+ai_narrative, risk_drift and capital_honesty all read the same 10-K. In
+fused mode the shared context (Business and MD&A, the Risk Factors YoY
+diff or section, the proxy's compensation discussion) goes out once and
+the model answers for all three in one JSON object, which is split back
+into the usual per-dimension results. About half the input tokens and
+two fewer calls per ticker, at the cost of the dimensions no longer being
+judged in isolation.
+"""
+
+from sayvdo.core import llm, riskdiff, sections
+
+DIMENSIONS = ("ai_narrative", "risk_drift", "capital_honesty")
+
+PROMPT = """You are analyzing SEC filings to score a company on three separate dimensions. Judge each dimension on its own evidence.
+
+1. ai_narrative — AI narrative integrity (Business and MD&A):
+- Specificity: Are AI claims tied to specific products, systems, or metrics? (vague buzzwords = low)
+- Financial Impact: Is AI investment quantified ($ spent, headcount, capex)?
+- Integration Depth, Competitive Moat, Execution Evidence (concrete AI outcomes cited)
+
+2. risk_drift — risk disclosure transparency (Risk Factors, or how they changed since the prior year):
+- New risks that appeared, and risks that quietly disappeared or were softened
+- Specific ("revenue from 3 customers represents 40%") vs vague ("macro uncertainty") language
+- Boilerplate vs substance; material risks mentioned only briefly
+
+3. capital_honesty — does capital allocation match stated priorities (MD&A, Business, proxy):
+- Stated priorities (AI, innovation, talent, long-term value) vs actual R&D, capex, compensation and buybacks
+- Are executives paid on short-term (revenue/EPS) or long-term metrics?
+
+Score each 0-100 where:
+- 90-100: Specific, well-supported, no obvious gaps
+- 70-89: Generally good with minor gaps
+- 50-69: Mixed — some substance, some boilerplate or mismatches
+- 30-49: Mostly vague, understated or misaligned
+- 0-29: Appears designed to obscure rather than disclose
+
+Return JSON only (no markdown):
+{
+  "ai_narrative": {"score": <0-100 integer>, "evidence": ["<direct quote>", ...], "flags": ["<concern>", ...], "summary": "<1-2 sentences>"},
+  "risk_drift": {"score": <0-100 integer>, "evidence": [...], "flags": [...], "summary": "..."},
+  "capital_honesty": {"score": <0-100 integer>, "evidence": [...], "flags": [...], "summary": "..."}
+}
+
+Filings:
+"""
+
+PROMPT_VERSION = 1
+
+
+def _risk_context(ten_k: dict, prior: dict | None) -> str:
+    current_1a = sections.section(ten_k, "1A")
+    if current_1a and prior:
+        prior_1a = sections.section(prior, "1A")
+        if prior_1a:
+            changes = riskdiff.diff(prior_1a, current_1a)
+            if changes["total"]:
+                return f"Changes since the {prior['date']} 10-K:\n" + riskdiff.render(changes, max_chars=20000)
+    if current_1a:
+        return current_1a[:20000]
+    return ""
+
+
+def _context(filing_data: dict) -> str:
+    ten_k = filing_data["10k"]
+    def14a = filing_data.get("def14a")
+    parts = [
+        "=== 10-K: BUSINESS AND MD&A ===",
+        sections.excerpt(ten_k, ("1", "7"), 45000) or ten_k["text"][:45000],
+    ]
+    risk = _risk_context(ten_k, filing_data.get("10k_prior"))
+    if risk:
+        parts += ["\n=== 10-K: RISK FACTORS ===", risk]
+    if def14a and def14a.get("text"):
+        compensation = sections.compensation_discussion(def14a, 15000) or def14a["text"][:15000]
+        parts += ["\n=== PROXY STATEMENT (DEF 14A) ===", compensation]
+    return "\n".join(parts)
+
+
+def score(ticker: str, filing_data: dict) -> dict | None:
+    """Results for DIMENSIONS keyed by name, or None to score them separately."""
+    ten_k = filing_data.get("10k")
+    if not ten_k or not ten_k.get("text"):
+        return None
+
+    parsed = llm.ask("fused", PROMPT_VERSION, PROMPT + _context(filing_data), required=DIMENSIONS)
+    if not parsed:
+        return None
+
+    results = {}
+    for dim_name in DIMENSIONS:
+        part = parsed[dim_name]
+        if not isinstance(part, dict) or not isinstance(part.get("score"), int):
+            return None
+        results[dim_name] = {
+            "dimension": dim_name,
+            "mode": "fused",
+            "score": part["score"],
+            "evidence": part.get("evidence", []),
+            "flags": part.get("flags", []),
+            "summary": part.get("summary", ""),
+        }
+    return results
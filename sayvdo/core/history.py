@@ -2,88 +2,544 @@
 
 import json
 import os
+import queue
 import sqlite3
+import threading
+import time
+
+from sayvdo.cache.lru import LRUCache
 
 DB_PATH = os.path.expanduser("~/projects/sayvdo/sayvdo.db")
 
+# Applied in order, once per database; PRAGMA user_version records progress.
+# Append new steps — never edit or reorder released ones.
+MIGRATIONS = [
+    """
+    CREATE TABLE IF NOT EXISTS scores (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ticker TEXT NOT NULL,
+        company TEXT,
+        quarter TEXT,
+        composite_score INTEGER,
+        ai_score INTEGER,
+        guidance_score INTEGER,
+        risk_drift_score INTEGER,
+        capital_score INTEGER,
+        esg_score INTEGER,
+        scanned_at TEXT DEFAULT (datetime('now')),
+        scores_json TEXT,
+        UNIQUE(ticker, quarter)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_scores_ticker_scanned ON scores(ticker, scanned_at DESC)",
+    "CREATE INDEX IF NOT EXISTS idx_scores_quarter_ticker ON scores(quarter, ticker)",
+    # Newest row per ticker, kept in step by save_score. `id` is the scores
+    # row it mirrors; `payload` is the compact JSON served verbatim by the API.
+    """
+    CREATE TABLE IF NOT EXISTS latest_scores (
+        ticker TEXT PRIMARY KEY,
+        id INTEGER NOT NULL,
+        company TEXT,
+        quarter TEXT,
+        composite_score INTEGER,
+        ai_score INTEGER,
+        guidance_score INTEGER,
+        risk_drift_score INTEGER,
+        capital_score INTEGER,
+        esg_score INTEGER,
+        scanned_at TEXT,
+        payload BLOB NOT NULL
+    )
+    """,
+    # Rows from before scores_json existed get a payload built from the
+    # summary columns, since payload can't be NULL
+    """
+    INSERT OR REPLACE INTO latest_scores
+    SELECT ticker, id, company, quarter, composite_score, ai_score, guidance_score,
+           risk_drift_score, capital_score, esg_score, scanned_at,
+           CAST(COALESCE(scores_json, json_object(
+               'ticker', ticker, 'company', company, 'quarter', quarter,
+               'composite_score', composite_score, 'scanned_at', scanned_at
+           )) AS BLOB)
+    FROM (
+        SELECT *, ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY scanned_at DESC) AS rn
+        FROM scores
+    )
+    WHERE rn = 1
+    """,
+]
+
+PRAGMAS = [
+    "PRAGMA journal_mode=WAL",     # readers never block the writer
+    "PRAGMA synchronous=NORMAL",   # safe with WAL, one fsync per checkpoint
+    "PRAGMA busy_timeout=10000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",    # 16 MB page cache per connection
+]
+
+# Sortable leaderboard columns; dimension names are accepted as aliases
+LEADERBOARD_COLUMNS = {
+    "composite_score": "composite_score",
+    "ai_score": "ai_score",
+    "guidance_score": "guidance_score",
+    "risk_drift_score": "risk_drift_score",
+    "capital_score": "capital_score",
+    "esg_score": "esg_score",
+    "scanned_at": "scanned_at",
+    "composite": "composite_score",
+    "ai_narrative": "ai_score",
+    "guidance_accuracy": "guidance_score",
+    "risk_drift": "risk_drift_score",
+    "capital_honesty": "capital_score",
+    "esg_substance": "esg_score",
+}
+
+SUMMARY_FIELDS = (
+    "id, ticker, company, quarter, composite_score, ai_score, guidance_score, "
+    "risk_drift_score, capital_score, esg_score, scanned_at"
+)
+
+# In-process cache of per-ticker reads, kept coherent by save_score. The TTL
+# bounds staleness from writes made by other processes (e.g. a batch run).
+HOT_CACHE_ENTRIES = 2048
+HOT_CACHE_BYTES = 64 * 1024 * 1024
+HOT_CACHE_TTL = 60
 
-def _conn():
-    conn = sqlite3.connect(DB_PATH)
+_hot = LRUCache(HOT_CACHE_ENTRIES, HOT_CACHE_BYTES, ttl=HOT_CACHE_TTL)
+# Columns of a bulk export/import row, in file order
+EXPORT_COLUMNS = (
+    "ticker", "company", "quarter", "composite_score", "ai_score", "guidance_score",
+    "risk_drift_score", "capital_score", "esg_score", "scanned_at", "scores_json",
+)
+
+_local = threading.local()
+_migrate_lock = threading.Lock()
+_migrated: set[str] = set()
+
+
+def _open(path: str, check_same_thread: bool = True) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10, check_same_thread=check_same_thread)
     conn.row_factory = sqlite3.Row
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _migrate(conn: sqlite3.Connection):
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for step, sql in enumerate(MIGRATIONS[version:], start=version + 1):
+        with conn:
+            conn.execute(sql)
+            conn.execute(f"PRAGMA user_version = {step}")
+
+
+def _conn() -> sqlite3.Connection:
+    """This thread's connection to DB_PATH, opened (and migrated) on first use."""
+    key = (DB_PATH, os.getpid())
+    conn = getattr(_local, "conn", None)
+    if conn is None or _local.key != key:
+        conn = _open(DB_PATH)
+        _local.conn, _local.key = conn, key
+    if DB_PATH not in _migrated:
+        with _migrate_lock:
+            if DB_PATH not in _migrated:
+                _migrate(conn)
+                _migrated.add(DB_PATH)
     return conn
 
 
 def init_db():
-    """Create tables if not exists."""
-    with _conn() as conn:
-        conn.execute("""
-            CREATE TABLE IF NOT EXISTS scores (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                ticker TEXT NOT NULL,
-                company TEXT,
-                quarter TEXT,
-                composite_score INTEGER,
-                ai_score INTEGER,
-                guidance_score INTEGER,
-                risk_drift_score INTEGER,
-                capital_score INTEGER,
-                esg_score INTEGER,
-                scanned_at TEXT DEFAULT (datetime('now')),
-                scores_json TEXT,
-                UNIQUE(ticker, quarter)
-            )
-        """)
+    """Create tables and indexes if needed. Runs once per process."""
+    _conn()
 
 
-def save_score(result: dict):
-    """Persist a scorer result to SQLite."""
-    init_db()
+def _encode(result: dict) -> bytes:
+    # Same bytes a JSONResponse would render, so the API can send them as-is
+    return json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def _write_score(conn: sqlite3.Connection, result: dict) -> tuple[str, dict | None]:
+    """Insert one result inside the caller's transaction.
+
+    Returns (ticker, latest) where latest is the payload entry to seed the
+    hot cache with, or None if an existing newer scan stayed the latest.
+    """
     dims = result.get("dimensions", {})
+    payload = _encode(result)
+    row = (
+        result["ticker"],
+        result.get("company"),
+        result.get("quarter"),
+        result.get("composite_score"),
+        dims.get("ai_narrative", {}).get("score"),
+        dims.get("guidance_accuracy", {}).get("score"),
+        dims.get("risk_drift", {}).get("score"),
+        dims.get("capital_honesty", {}).get("score"),
+        dims.get("esg_substance", {}).get("score"),
+        result.get("scanned_at"),
+    )
+
+    cur = conn.execute("""
+        INSERT OR REPLACE INTO scores
+            (ticker, company, quarter, composite_score,
+             ai_score, guidance_score, risk_drift_score, capital_score, esg_score,
+             scanned_at, scores_json)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, row + (json.dumps(result),))
+    # Same transaction, so readers never see scores and latest disagree.
+    # An older scan (e.g. a back-filled quarter) doesn't displace a newer one.
+    upsert = conn.execute("""
+        INSERT INTO latest_scores
+            (id, ticker, company, quarter, composite_score,
+             ai_score, guidance_score, risk_drift_score, capital_score, esg_score,
+             scanned_at, payload)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(ticker) DO UPDATE SET
+            id = excluded.id,
+            company = excluded.company,
+            quarter = excluded.quarter,
+            composite_score = excluded.composite_score,
+            ai_score = excluded.ai_score,
+            guidance_score = excluded.guidance_score,
+            risk_drift_score = excluded.risk_drift_score,
+            capital_score = excluded.capital_score,
+            esg_score = excluded.esg_score,
+            scanned_at = excluded.scanned_at,
+            payload = excluded.payload
+        WHERE excluded.scanned_at >= latest_scores.scanned_at
+           OR latest_scores.scanned_at IS NULL
+    """, (cur.lastrowid,) + row + (payload,))
 
+    latest = None
+    if upsert.rowcount:
+        latest = {"payload": payload, "id": cur.lastrowid, "scanned_at": result.get("scanned_at")}
+    else:
+        # The replace may have deleted the row latest_scores pointed at
+        # (same quarter rescanned with an older scanned_at)
+        _derive_latest(conn, [result["ticker"]])
+    return result["ticker"], latest
+
+
+def _derive_latest(conn: sqlite3.Connection, tickers):
+    """Rebuild latest_scores rows for `tickers` from scores, inside the caller's transaction."""
+    conn.execute("""
+        INSERT OR REPLACE INTO latest_scores
+        SELECT ticker, id, company, quarter, composite_score, ai_score, guidance_score,
+               risk_drift_score, capital_score, esg_score, scanned_at, CAST(scores_json AS BLOB)
+        FROM (
+            SELECT *, ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY scanned_at DESC) AS rn
+            FROM scores
+            WHERE ticker IN (SELECT value FROM json_each(?))
+        )
+        WHERE rn = 1
+    """, (json.dumps(sorted(tickers)),))
+
+
+def _write_through(written: list[tuple[str, dict | None]]):
+    # Drop everything cached for each ticker, then seed the payload the API
+    # will ask for next when the scan became the latest
+    for ticker, latest in written:
+        _hot.invalidate_tag(ticker)
+        if latest:
+            _hot.put(("payload", ticker), latest, len(latest["payload"]), tag=ticker)
+
+
+def save_score(result: dict):
+    """Persist a scorer result to SQLite and refresh the ticker's latest row."""
+    save_scores([result])
+
+
+def save_scores(results: list[dict]):
+    """Persist several scorer results in a single transaction."""
+    if not results:
+        return
     with _conn() as conn:
-        conn.execute("""
-            INSERT OR REPLACE INTO scores
-                (ticker, company, quarter, composite_score,
-                 ai_score, guidance_score, risk_drift_score, capital_score, esg_score,
-                 scanned_at, scores_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            result["ticker"],
-            result.get("company"),
-            result.get("quarter"),
-            result.get("composite_score"),
-            dims.get("ai_narrative", {}).get("score"),
-            dims.get("guidance_accuracy", {}).get("score"),
-            dims.get("risk_drift", {}).get("score"),
-            dims.get("capital_honesty", {}).get("score"),
-            dims.get("esg_substance", {}).get("score"),
-            result.get("scanned_at"),
-            json.dumps(result),
-        ))
+        written = [_write_score(conn, result) for result in results]
+    _write_through(written)
+
+
+class BatchWriter:
+    """Queue-backed writer that lands results in batched transactions.
+
+    save() returns immediately; a background thread commits whenever
+    `max_rows` results are queued or `flush_interval` seconds have passed
+    since the oldest unflushed one, so a crash loses at most one batch.
+    Use as a context manager (or call close()) to flush the remainder.
+    Results saved after close() — e.g. by scans still finishing after an
+    interrupt — are committed directly instead of being dropped.
+    """
+
+    _STOP = object()
+
+    def __init__(self, max_rows: int = 50, flush_interval: float = 5.0):
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.error: Exception | None = None
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._loop, name="sayvdo-history-writer", daemon=True)
+        self._thread.start()
+
+    def save(self, result: dict):
+        if self.error:
+            raise self.error
+        with self._lock:
+            if not self._closed:
+                self._queue.put(result)
+                return
+        save_scores([result])
+        self.written += 1
+
+    def flush(self):
+        """Block until everything saved so far is committed."""
+        with self._lock:
+            if self._closed:
+                return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        if self.error:
+            raise self.error
+
+    def close(self):
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                self._queue.put(self._STOP)
+        self._thread.join()
+        if self.error:
+            raise self.error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _commit(self, batch: list[dict]):
+        if not batch:
+            return
+        try:
+            save_scores(batch)
+            self.written += len(batch)
+        except Exception as e:
+            self.error = e
+            print(f"  [history] Failed to write batch of {len(batch)}: {e}")
+        batch.clear()
+
+    def _loop(self):
+        batch: list[dict] = []
+        deadline = 0.0
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if batch else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._commit(batch)
+                continue
+
+            if item is self._STOP:
+                self._commit(batch)
+                return
+            if isinstance(item, threading.Event):
+                self._commit(batch)
+                item.set()
+                continue
+
+            if not batch:
+                deadline = time.monotonic() + self.flush_interval
+            batch.append(item)
+            if len(batch) >= self.max_rows:
+                self._commit(batch)
+
+
+def _row_size(row: dict) -> int:
+    return 256 + sum(len(v) for v in row.values() if isinstance(v, (str, bytes)))
 
 
 def get_history(ticker: str, limit: int = 8) -> list[dict]:
     """Get score history for a ticker."""
-    init_db()
-    with _conn() as conn:
-        rows = conn.execute("""
-            SELECT * FROM scores
-            WHERE ticker = ?
-            ORDER BY scanned_at DESC
-            LIMIT ?
-        """, (ticker.upper(), limit)).fetchall()
-    return [dict(r) for r in rows]
+    ticker = ticker.upper()
+    key = ("history", ticker, limit)
+    cached = _hot.get(key)
+    if cached is None:
+        generation = _hot.generation(ticker)
+        with _conn() as conn:
+            rows = conn.execute("""
+                SELECT * FROM scores
+                WHERE ticker = ?
+                ORDER BY scanned_at DESC
+                LIMIT ?
+            """, (ticker, limit)).fetchall()
+        cached = [dict(r) for r in rows]
+        _hot.put(key, cached, sum(map(_row_size, cached)), tag=ticker, generation=generation)
+    return [dict(r) for r in cached]
 
 
 def get_latest(ticker: str) -> dict | None:
     """Get the most recent score for a ticker."""
-    rows = get_history(ticker, limit=1)
-    return rows[0] if rows else None
+    ticker = ticker.upper()
+    key = ("latest", ticker)
+    cached = _hot.get(key)
+    if cached is None:
+        generation = _hot.generation(ticker)
+        with _conn() as conn:
+            row = conn.execute(
+                f"SELECT {SUMMARY_FIELDS}, payload FROM latest_scores WHERE ticker = ?",
+                (ticker,),
+            ).fetchone()
+        if row is None:
+            return None
+        cached = dict(row)
+        cached["scores_json"] = cached.pop("payload").decode()
+        _hot.put(key, cached, _row_size(cached), tag=ticker, generation=generation)
+    return dict(cached)
+
+
+def get_latest_payload(ticker: str) -> dict | None:
+    """{"payload", "id", "scanned_at"} for the latest result — one primary-key lookup.
+
+    `payload` is ready-to-send JSON bytes; `id` and `scanned_at` identify the
+    row version for HTTP validators. Hot tickers are served from memory.
+    """
+    ticker = ticker.upper()
+    key = ("payload", ticker)
+    cached = _hot.get(key)
+    if cached is None:
+        generation = _hot.generation(ticker)
+        with _conn() as conn:
+            row = conn.execute(
+                "SELECT payload, id, scanned_at FROM latest_scores WHERE ticker = ?",
+                (ticker,),
+            ).fetchone()
+        if row is None:
+            return None
+        cached = {"payload": bytes(row["payload"]), "id": row["id"], "scanned_at": row["scanned_at"]}
+        _hot.put(key, cached, len(cached["payload"]), tag=ticker, generation=generation)
+    return dict(cached)
+
+
+def cache_stats() -> dict:
+    """Hit/miss/eviction counters and size of the in-process read cache."""
+    return _hot.stats()
 
 
 def get_all_tickers() -> list[str]:
     """Get all tickers in the database."""
-    init_db()
     with _conn() as conn:
-        rows = conn.execute("SELECT DISTINCT ticker FROM scores ORDER BY ticker").fetchall()
+        rows = conn.execute("SELECT ticker FROM latest_scores ORDER BY ticker").fetchall()
     return [r["ticker"] for r in rows]
+
+
+def get_scored_tickers(quarter: str) -> set[str]:
+    """Tickers that already have a score saved for `quarter`."""
+    with _conn() as conn:
+        rows = conn.execute("SELECT ticker FROM scores WHERE quarter = ?", (quarter,)).fetchall()
+    return {r["ticker"] for r in rows}
+
+
+def get_leaderboard(sort: str = "composite_score", descending: bool = True,
+                    limit: int = 20, offset: int = 0) -> list[dict]:
+    """Latest score row per ticker, ordered by `sort`, in a single query.
+
+    Rows carry the per-dimension columns but not the full result JSON.
+    """
+    column = LEADERBOARD_COLUMNS.get(sort)
+    if column is None:
+        raise ValueError(f"Unknown leaderboard column: {sort}")
+    direction = "DESC" if descending else "ASC"
+    with _conn() as conn:
+        rows = conn.execute(f"""
+            SELECT {SUMMARY_FIELDS} FROM latest_scores
+            ORDER BY {column} {direction} NULLS LAST, ticker
+            LIMIT ? OFFSET ?
+        """, (limit, offset)).fetchall()
+    return [dict(r) for r in rows]
+
+
+def count_tickers() -> int:
+    with _conn() as conn:
+        return conn.execute("SELECT COUNT(*) FROM latest_scores").fetchone()[0]
+
+
+def iter_scores(ticker: str | None = None, quarter: str | None = None,
+                since: str | None = None, until: str | None = None,
+                batch_size: int = 500):
+    """Stream score rows (EXPORT_COLUMNS dicts) ordered by ticker, scanned_at.
+
+    Rows are pulled from the cursor `batch_size` at a time so memory stays
+    flat however large the table is. `since` is inclusive and `until`
+    exclusive, both compared against scanned_at (ISO dates or timestamps).
+    Uses its own connection, so the generator may be resumed from any thread.
+    """
+    init_db()
+    clauses, params = [], []
+    for clause, value in (("ticker = ?", ticker and ticker.upper()), ("quarter = ?", quarter),
+                          ("scanned_at >= ?", since), ("scanned_at < ?", until)):
+        if value:
+            clauses.append(clause)
+            params.append(value)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    conn = _open(DB_PATH, check_same_thread=False)
+    try:
+        cur = conn.execute(
+            f"SELECT {', '.join(EXPORT_COLUMNS)} FROM scores {where} ORDER BY ticker, scanned_at",
+            params,
+        )
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
+    finally:
+        conn.close()
+
+
+def import_scores(rows, batch_size: int = 1000) -> int:
+    """Bulk-load EXPORT_COLUMNS dicts in one transaction. Returns rows written.
+
+    Rows replace existing ones with the same ticker/quarter, as save_score
+    does. `scores_json` may be a JSON string or an already-parsed dict; a
+    row without one raises ValueError, since it becomes the payload served
+    for the ticker, and nothing is written.
+    """
+    conn = _conn()
+    placeholders = ", ".join("?" for _ in EXPORT_COLUMNS)
+    sql = f"INSERT OR REPLACE INTO scores ({', '.join(EXPORT_COLUMNS)}) VALUES ({placeholders})"
+    tickers: set[str] = set()
+    written = 0
+
+    def _values(row: dict) -> tuple:
+        row = dict(row)
+        row["ticker"] = row["ticker"].upper()
+        if isinstance(row.get("scores_json"), dict):
+            row["scores_json"] = json.dumps(row["scores_json"])
+        if not row.get("scores_json"):
+            raise ValueError(f"{row['ticker']} {row.get('quarter')}: row has no scores_json")
+        tickers.add(row["ticker"])
+        # CSV has no NULL — empty cells come back as ""
+        return tuple(None if row.get(col) == "" else row.get(col) for col in EXPORT_COLUMNS)
+
+    with conn:
+        batch = []
+        for row in rows:
+            batch.append(_values(row))
+            if len(batch) >= batch_size:
+                conn.executemany(sql, batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            conn.executemany(sql, batch)
+            written += len(batch)
+
+        # Re-derive latest rows for every ticker touched, inside the same transaction
+        _derive_latest(conn, tickers)
+
+    for ticker in tickers:
+        _hot.invalidate_tag(ticker)
+    return written
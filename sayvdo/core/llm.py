@@ -0,0 +1,222 @@
+"""Model backends — one place where a prompt becomes a parsed JSON result.
+
+  subprocess  the claude-wrapper CLI, prompt on stdin (default)
+  http        Messages-style JSON POST to ENDPOINT over one pooled
+              keep-alive session
+  stub        canned, well-formed answers without any model, for running
+              the pipeline offline; serve_stub() exposes the same answers
+              over HTTP so the http backend can be load-tested too
+
+Every backend shares one concurrency limit and one call policy (adaptive
+timeouts, jittered retries, optional hedging, a circuit breaker — see
+resilience), and ask() wraps the result cache and JSON parsing that each
+dimension used to repeat.
+
+Every prompt template sits next to a *PROMPT_VERSION constant that is
+passed to ask(). Bump it whenever the template changes: it keys the result
+cache, and incremental rescoring (see scorer) won't reuse a stored
+dimension scored under a different version.
+
+Configured from the environment: SAYVDO_LLM_BACKEND, SAYVDO_LLM_COMMAND,
+SAYVDO_LLM_ENDPOINT, SAYVDO_LLM_MODEL, SAYVDO_LLM_API_KEY,
+SAYVDO_LLM_CONCURRENCY, SAYVDO_LLM_HEDGE, SAYVDO_LLM_STUB_LATENCY.
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from sayvdo.cache import llm_cache
+from sayvdo.core import resilience
+
+BACKEND = os.environ.get("SAYVDO_LLM_BACKEND", "subprocess")
+COMMAND = os.environ.get("SAYVDO_LLM_COMMAND", "/Users/justinadair/bin/claude-wrapper")
+ENDPOINT = os.environ.get("SAYVDO_LLM_ENDPOINT", "http://127.0.0.1:8765/v1/messages")
+MODEL = os.environ.get("SAYVDO_LLM_MODEL", "")
+API_KEY = os.environ.get("SAYVDO_LLM_API_KEY", "")
+CONCURRENCY = int(os.environ.get("SAYVDO_LLM_CONCURRENCY", "16"))
+STUB_LATENCY = float(os.environ.get("SAYVDO_LLM_STUB_LATENCY", "0"))
+
+HEDGE = os.environ.get("SAYVDO_LLM_HEDGE", "") not in ("", "0")
+
+TIMEOUT = 120  # seconds per attempt, before latencies are known
+BUDGET = 140   # seconds per call, retries included; under scorer.DIMENSION_TIMEOUT
+MAX_TOKENS = 4096
+
+_slots = threading.BoundedSemaphore(CONCURRENCY)
+
+policy = resilience.CallPolicy(max_timeout=TIMEOUT, budget=BUDGET, hedge=HEDGE)
+
+
+def stats() -> dict:
+    return {"backend": BACKEND, "model": model_id(), **policy.stats()}
+
+
+def set_concurrency(limit: int):
+    """Resize the process-wide model-call limit (`--llm-concurrency`).
+
+    Call before scoring starts; calls already holding a slot finish under
+    the old limit.
+    """
+    global _slots
+    _slots = threading.BoundedSemaphore(max(1, limit))
+
+
+def model_id() -> str:
+    """Identifies what answered, so cached results from different models don't mix."""
+    if BACKEND == "stub":
+        return "stub"
+    if BACKEND == "http":
+        return MODEL or ENDPOINT
+    return llm_cache.MODEL_ID
+
+
+def _run_subprocess(prompt: str, timeout: float) -> str:
+    # Prompt on stdin: a 60k-character argv is close to ARG_MAX on some systems
+    result = subprocess.run(
+        [COMMAND, "-p"],
+        input=prompt,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{os.path.basename(COMMAND)} exited {result.returncode}: {result.stderr.strip()[:200]}")
+    return result.stdout
+
+
+# One session for the process, so connections to the endpoint are kept
+# alive across the short-lived worker pools that make the calls
+_session = requests.Session()
+_session.headers["Content-Type"] = "application/json"
+if API_KEY:
+    _session.headers["x-api-key"] = API_KEY
+    _session.headers["anthropic-version"] = "2023-06-01"
+_session.mount("http://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=CONCURRENCY))
+_session.mount("https://", requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=CONCURRENCY))
+
+
+def _run_http(prompt: str, timeout: float) -> str:
+    body = {"max_tokens": MAX_TOKENS, "messages": [{"role": "user", "content": prompt}]}
+    if MODEL:
+        body["model"] = MODEL
+    resp = _session.post(ENDPOINT, json=body, timeout=timeout)
+    resp.raise_for_status()
+    return "".join(block.get("text", "") for block in resp.json().get("content", []))
+
+
+def stub_answer(prompt: str) -> str:
+    """A well-formed answer for any sayvdo prompt, derived from the prompt itself."""
+    if '"notes"' in prompt:
+        return json.dumps({"notes": ["stub note"]})
+    score = int(hashlib.md5(prompt.encode()).hexdigest(), 16) % 101
+    answer = {
+        "score": score,
+        "evidence": ["stub evidence"],
+        "flags": ["Stub backend — not a real analysis"],
+        "summary": "Stub result.",
+    }
+    # Fused prompts ask for one object per dimension
+    fused = re.findall(r'"(\w+)":\s*\{"score"', prompt)
+    if fused:
+        return json.dumps({name: answer for name in fused})
+    match = re.search(r'"dimension":\s*"(\w+)"', prompt)
+    return json.dumps({"dimension": match.group(1) if match else "unknown", **answer})
+
+
+def _run_stub(prompt: str, timeout: float) -> str:
+    if STUB_LATENCY:
+        time.sleep(STUB_LATENCY)
+    return stub_answer(prompt)
+
+
+BACKENDS = {
+    "subprocess": _run_subprocess,
+    "http": _run_http,
+    "stub": _run_stub,
+}
+
+
+def _attempt(prompt: str, timeout: float) -> str:
+    with _slots:
+        return BACKENDS[BACKEND](prompt, timeout)
+
+
+def parse_json(raw: str) -> dict | None:
+    """The outermost JSON object in model output, or None."""
+    start = raw.find("{")
+    end = raw.rfind("}") + 1
+    if start < 0 or end <= start:
+        return None
+    try:
+        parsed = json.loads(raw[start:end])
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def ask(dimension: str, prompt_version: int, prompt: str,
+        required: tuple[str, ...] = ("dimension", "score")) -> dict | None:
+    """Cached model call returning the parsed result, or None on any failure.
+
+    A result only counts (and is cached) if it has every `required` key.
+    None means the call failed — callers report the dimension as missing.
+    """
+    model = model_id()
+    cached = llm_cache.get(dimension, prompt_version, prompt, model=model)
+    if cached:
+        return cached
+    try:
+        # Malformed output is retried like a failed call
+        parsed = policy.run(
+            lambda timeout: parse_json(_attempt(prompt, timeout)),
+            accept=lambda p: p is not None and all(key in p for key in required),
+        )
+    except Exception:
+        return None
+    llm_cache.put(dimension, prompt_version, prompt, parsed, model=model)
+    return parsed
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like a real endpoint
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        prompt = "".join(
+            m["content"] if isinstance(m.get("content"), str) else ""
+            for m in body.get("messages", [])
+        )
+        if STUB_LATENCY:
+            time.sleep(STUB_LATENCY)
+        payload = json.dumps({
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "stub"),
+            "content": [{"type": "text", "text": stub_answer(prompt)}],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_stub(host: str = "127.0.0.1", port: int = 8765):
+    """Serve stub answers in the http backend's format until interrupted."""
+    server = ThreadingHTTPServer((host, port), _StubHandler)
+    print(f"Stub model listening on http://{host}:{port}/v1/messages")
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
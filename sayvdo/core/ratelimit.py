@@ -0,0 +1,64 @@
+"""Token-bucket rate limiter shared across threads and processes.
+
+SEC asks for no more than 10 requests/second per client, and that budget is
+shared by every thread and every worker process on the machine. The bucket
+is kept in GCRA form — a single "theoretical arrival time" — in a small state
+file guarded by flock, so all processes draw from the same bucket. A caller
+reserves its slot under the lock and sleeps outside it, so concurrent
+callers queue up in arrival order without holding the lock while waiting.
+"""
+
+import os
+import struct
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows — fall back to a per-process bucket
+    fcntl = None
+
+_STATE = struct.Struct("d")
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1, state_path: str | None = None):
+        self.interval = 1.0 / rate
+        self.burst = max(1, burst)
+        self.state_path = state_path if fcntl else None
+        self._lock = threading.Lock()
+        self._tat = 0.0
+        self._fd = None
+        self._fd_pid = None
+
+    def _open(self) -> int:
+        # Re-open after fork so children don't share the parent's descriptor
+        if self._fd is None or self._fd_pid != os.getpid():
+            self._fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o644)
+            self._fd_pid = os.getpid()
+        return self._fd
+
+    def _reserve(self, tat: float) -> tuple[float, float]:
+        """Return (new_tat, seconds_to_wait) for one request."""
+        now = time.time()
+        tat = max(tat, now)
+        wait = max(0.0, tat - (self.burst - 1) * self.interval - now)
+        return tat + self.interval, wait
+
+    def acquire(self):
+        """Block until one request may be sent."""
+        with self._lock:
+            if self.state_path is None:
+                self._tat, wait = self._reserve(self._tat)
+            else:
+                fd = self._open()
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                try:
+                    raw = os.pread(fd, _STATE.size, 0)
+                    tat = _STATE.unpack(raw)[0] if len(raw) == _STATE.size else 0.0
+                    tat, wait = self._reserve(tat)
+                    os.pwrite(fd, _STATE.pack(tat), 0)
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+        if wait > 0:
+            time.sleep(wait)
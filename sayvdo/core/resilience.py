@@ -0,0 +1,196 @@
+"""Call-execution policy for model backends.
+
+  adaptive timeout  a multiple of the recent p99 latency, clamped to
+                    [min_timeout, max_timeout], once enough calls have
+                    been seen — a hung call no longer costs the full limit
+  retries           bounded, with full-jitter exponential backoff, within
+                    an overall time budget per call
+  hedging           optional: if a call runs past the recent p95, a
+                    duplicate is started and the first answer wins
+  circuit breaker   after `failure_threshold` consecutive failures calls
+                    fail fast for `reset_timeout` seconds, then a single
+                    probe decides whether to close it again
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a backend that is known to be down."""
+
+
+class UnusableResponse(RuntimeError):
+    """The backend answered, but not with something the caller can use."""
+
+
+class LatencyTracker:
+    """Rolling window of successful call durations."""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, p: float) -> float | None:
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if self._probing or time.monotonic() - self._opened_at >= self.reset_timeout:
+                return "half-open"
+            return "open"
+
+    def before_call(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._probing or time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError(f"model backend unavailable after {self._failures} consecutive failures")
+            self._probing = True  # this caller is the probe
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class CallPolicy:
+    def __init__(self, max_timeout: float, min_timeout: float = 15.0, timeout_multiplier: float = 2.0,
+                 min_samples: int = 20, max_attempts: int = 3, backoff: float = 1.0,
+                 budget: float | None = None, hedge: bool = False,
+                 breaker: CircuitBreaker | None = None):
+        self.max_timeout = max_timeout
+        self.min_timeout = min_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.min_samples = min_samples
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.budget = budget if budget is not None else max_timeout
+        self.hedge = hedge
+        self.breaker = breaker or CircuitBreaker()
+        self.latencies = LatencyTracker()
+        self.retries = 0
+        self.hedges = 0
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def timeout(self) -> float:
+        if len(self.latencies) < self.min_samples:
+            return self.max_timeout
+        adaptive = self.latencies.percentile(99) * self.timeout_multiplier
+        return max(self.min_timeout, min(self.max_timeout, adaptive))
+
+    def _timed(self, fn, timeout: float):
+        start = time.monotonic()
+        result = fn(timeout)
+        self.latencies.record(time.monotonic() - start)
+        return result
+
+    def _executor(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=32, thread_name_prefix="sayvdo-hedge")
+            return self._pool
+
+    def _hedged(self, fn, timeout: float):
+        p95 = self.latencies.percentile(95) if len(self.latencies) >= self.min_samples else None
+        if p95 is None or p95 >= timeout:
+            return self._timed(fn, timeout)
+
+        pool = self._executor()
+        pending = {pool.submit(self._timed, fn, timeout)}
+        done, _ = wait(pending, timeout=p95)
+        if not done:
+            # The straggler keeps running until its own timeout; whichever
+            # answers first is used
+            self.hedges += 1
+            pending.add(pool.submit(self._timed, fn, timeout - p95))
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    return future.result()
+                except Exception as e:
+                    error = e
+        raise error
+
+    def run(self, fn, accept=None):
+        """Call fn(timeout) under the policy and return the first accepted result.
+
+        `accept(result)` False counts as a failed attempt (and is retried)
+        but not as a backend failure. Raises the last error when attempts or
+        the time budget run out, or CircuitOpenError without calling fn.
+        """
+        deadline = time.monotonic() + self.budget
+        error: Exception = UnusableResponse("no attempts made")
+        for attempt in range(self.max_attempts):
+            self.breaker.before_call()
+            timeout = min(self.timeout(), deadline - time.monotonic())
+            if timeout <= 0:
+                break
+            try:
+                result = self._hedged(fn, timeout) if self.hedge else self._timed(fn, timeout)
+            except Exception as e:
+                self.breaker.record_failure()
+                error = e
+            else:
+                self.breaker.record_success()
+                if accept is None or accept(result):
+                    return result
+                error = UnusableResponse("model response could not be used")
+
+            if attempt + 1 < self.max_attempts:
+                delay = random.uniform(0, self.backoff * 2 ** attempt)
+                if time.monotonic() + delay >= deadline:
+                    break
+                self.retries += 1
+                time.sleep(delay)
+        raise error
+
+    def stats(self) -> dict:
+        p50, p95 = self.latencies.percentile(50), self.latencies.percentile(95)
+        return {
+            "samples": len(self.latencies),
+            "p50": round(p50, 2) if p50 is not None else None,
+            "p95": round(p95, 2) if p95 is not None else None,
+            "timeout": round(self.timeout(), 1),
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "circuit": self.breaker.state,
+        }
@@ -0,0 +1,194 @@
+"""Year-over-year diff of 10-K Risk Factors (Item 1A).
+
+Each year's section is split into risk-factor paragraphs and matched
+across years in three passes, cheapest first:
+
+  exact    identical paragraphs after normalising case and whitespace
+  LSH      MinHash signatures over word shingles, banded so only
+           paragraphs sharing a band are compared
+  verify   exact Jaccard similarity of the shingle sets for each
+           candidate pair, matched greedily best-first
+
+Most of a year-on-year Risk Factors section is carried over verbatim, so
+the first pass settles nearly everything and MinHash runs on the few
+paragraphs left. Matched pairs below UNCHANGED_SIMILARITY are reported as
+changed; everything unmatched is added or removed.
+"""
+
+import random
+import re
+import zlib
+
+MIN_WORDS = 12           # shorter paragraphs are sub-headings, captions, etc.
+SHINGLE_WORDS = 5
+NUM_PERM = 64
+BANDS = 16               # NUM_PERM / BANDS rows per band
+MATCH_SIMILARITY = 0.4   # below this two paragraphs are different risks
+UNCHANGED_SIMILARITY = 0.9
+
+_SENTENCE_END = re.compile(r"[.!?:;][\"'”’)\]]*$")
+_PAGE_FURNITURE = re.compile(r"^(\d{1,3}|[ivx]+|table of contents)$", re.I)
+
+_PRIME = (1 << 61) - 1
+_rng = random.Random(1009)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def _normalize(paragraph: str) -> str:
+    return " ".join(paragraph.lower().split())
+
+
+def paragraphs(section: str) -> list[str]:
+    """Risk-factor paragraphs of an Item 1A section, in order.
+
+    extract puts every text node on its own line, so a sentence with inline
+    <b>/<i>/<span> markup arrives in pieces. Lines are joined until one
+    ends a sentence; page numbers and "Table of Contents" links are skipped.
+    """
+    units, current = [], []
+
+    def close():
+        paragraph = " ".join(current)
+        if len(paragraph.split()) >= MIN_WORDS:
+            units.append(paragraph)
+        current.clear()
+
+    for line in section.splitlines():
+        line = line.strip()
+        if not line:
+            if current:
+                close()
+            continue
+        if _PAGE_FURNITURE.match(line):
+            continue
+        current.append(line)
+        if _SENTENCE_END.search(line):
+            close()
+    if current:
+        close()
+    return units
+
+
+def shingles(paragraph: str) -> set[int]:
+    words = re.findall(r"\w+", paragraph.lower())
+    if len(words) <= SHINGLE_WORDS:
+        return {zlib.crc32(" ".join(words).encode())}
+    return {
+        zlib.crc32(" ".join(words[i:i + SHINGLE_WORDS]).encode())
+        for i in range(len(words) - SHINGLE_WORDS + 1)
+    }
+
+
+def minhash(shingle_set: set[int]) -> list[int]:
+    return [min((a * x + b) % _PRIME for x in shingle_set) for a, b in _PERMS]
+
+
+def jaccard(a: set, b: set) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _candidates(old_sigs: dict[int, list[int]], new_sigs: dict[int, list[int]]) -> set[tuple[int, int]]:
+    """(old, new) index pairs that collide in at least one LSH band."""
+    rows = NUM_PERM // BANDS
+    pairs = set()
+    for band in range(BANDS):
+        lo, hi = band * rows, (band + 1) * rows
+        buckets: dict[tuple, list[int]] = {}
+        for i, sig in old_sigs.items():
+            buckets.setdefault(tuple(sig[lo:hi]), []).append(i)
+        for j, sig in new_sigs.items():
+            for i in buckets.get(tuple(sig[lo:hi]), ()):
+                pairs.add((i, j))
+    return pairs
+
+
+def diff(prior_section: str, current_section: str) -> dict:
+    """Compare two Item 1A sections.
+
+    Returns {"added": [text], "removed": [text],
+             "changed": [(prior, current, similarity)],
+             "unchanged": count, "total": count in the current year}.
+    """
+    old = paragraphs(prior_section)
+    new = paragraphs(current_section)
+
+    # Pass 1: exact matches
+    by_text: dict[str, list[int]] = {}
+    for i, p in enumerate(old):
+        by_text.setdefault(_normalize(p), []).append(i)
+    old_left = set(range(len(old)))
+    new_left = []
+    unchanged = 0
+    for j, p in enumerate(new):
+        same = by_text.get(_normalize(p))
+        if same:
+            old_left.discard(same.pop(0))
+            unchanged += 1
+        else:
+            new_left.append(j)
+
+    # Pass 2 and 3: near matches among what's left
+    old_shingles = {i: shingles(old[i]) for i in old_left}
+    new_shingles = {j: shingles(new[j]) for j in new_left}
+    pairs = _candidates(
+        {i: minhash(s) for i, s in old_shingles.items()},
+        {j: minhash(s) for j, s in new_shingles.items()},
+    )
+    scored = sorted(
+        ((jaccard(old_shingles[i], new_shingles[j]), i, j) for i, j in pairs),
+        reverse=True,
+    )
+
+    changed = []
+    matched_new = set()
+    for similarity, i, j in scored:
+        if similarity < MATCH_SIMILARITY:
+            break
+        if i not in old_left or j in matched_new:
+            continue
+        old_left.discard(i)
+        matched_new.add(j)
+        if similarity >= UNCHANGED_SIMILARITY:
+            unchanged += 1
+        else:
+            changed.append((j, old[i], new[j], round(similarity, 2)))
+
+    changed.sort()
+    return {
+        "added": [new[j] for j in new_left if j not in matched_new],
+        "removed": [old[i] for i in sorted(old_left)],
+        "changed": [(prior, current, similarity) for _, prior, current, similarity in changed],
+        "unchanged": unchanged,
+        "total": len(new),
+    }
+
+
+def has_changes(result: dict) -> bool:
+    return bool(result["added"] or result["removed"] or result["changed"])
+
+
+def render(result: dict, max_chars: int = 30000, max_paragraph_chars: int = 2000) -> str:
+    """Prompt-ready text listing what changed, most informative first."""
+    def clip(text):
+        return text if len(text) <= max_paragraph_chars else text[:max_paragraph_chars] + " [...]"
+
+    lines = [
+        f"{result['total']} risk-factor paragraphs this year: {result['unchanged']} carried over "
+        f"unchanged, {len(result['changed'])} reworded, {len(result['added'])} new, "
+        f"{len(result['removed'])} removed since the prior 10-K.",
+    ]
+    if result["added"]:
+        lines.append("\n=== NEW THIS YEAR ===")
+        lines += [f"+ {clip(p)}" for p in result["added"]]
+    if result["changed"]:
+        lines.append("\n=== REWORDED (prior → current) ===")
+        for prior, current, similarity in result["changed"]:
+            lines.append(f"- PRIOR: {clip(prior)}\n  CURRENT: {clip(current)}\n  (similarity {similarity})")
+    if result["removed"]:
+        lines.append("\n=== REMOVED SINCE PRIOR YEAR ===")
+        lines += [f"- {clip(p)}" for p in result["removed"]]
+
+    text = "\n".join(lines)
+    return text if len(text) <= max_chars else text[:max_chars] + "\n[... truncated]"
@@ -1,8 +1,15 @@
 """Composite scorer — runs all 5 dimensions and returns weighted score."""
 
 import datetime
-from sayvdo.core import fetcher
+import hashlib
+import json
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from sayvdo.core import chunked, fetcher, fused, history, singleflight
 from sayvdo.core.dimensions import (
+    missing,
     ai_narrative,
     guidance_accuracy,
     risk_drift,
@@ -26,6 +33,44 @@ SCORERS = [
     esg_substance,
 ]
 
+# Dimensions are independent given filing_data, so they run side by side
+MAX_CONCURRENCY = len(SCORERS)
+DIMENSION_TIMEOUT = 150  # seconds per sequential model call, once a dimension starts
+TOTAL_DEADLINE = 300     # seconds, for all dimensions together
+
+# Dimensions that may make more than one model call in a row, each up to
+# llm.BUDGET: risk_drift falls back from the YoY diff to the full section
+MODEL_CALLS = {"risk_drift": 2}
+
+# Dimensions that try chunked.analyze before their usual call in chunked
+# mode: its map phase (up to chunked.MAP_BUDGET) and reduce call come first
+CHUNKED = ("ai_narrative", "guidance_accuracy", "capital_honesty", "esg_substance")
+
+# Process-wide cap on dimensions being scored at once, across all tickers.
+# A dimension's clock starts once it holds one of these slots; the model
+# calls it makes are capped separately by llm.CONCURRENCY (and chunked map
+# calls by chunked.MAP_CONCURRENCY), so keep this at or below those.
+DIMENSION_CONCURRENCY = 10
+
+# Score the 10-K dimensions from one shared-context call (see fused)
+FUSED = False
+
+# Reuse stored dimensions whose input filings haven't changed since the
+# last scan (`--full` turns this off)
+INCREMENTAL = True
+
+# Filing inputs each dimension reads — fetcher.FETCHERS keys
+INPUTS = {
+    "ai_narrative": ("10k",),
+    "guidance_accuracy": ("8ks",),
+    "risk_drift": ("10k", "10k_prior"),
+    "capital_honesty": ("10k", "def14a"),
+    "esg_substance": ("def14a",),
+}
+
+_scans = singleflight.Group()
+_dimension_slots = threading.BoundedSemaphore(DIMENSION_CONCURRENCY)
+
 
 def _current_quarter() -> str:
     now = datetime.datetime.now()
@@ -33,41 +78,287 @@ def _current_quarter() -> str:
     return f"Q{q}-{now.year}"
 
 
-def run(ticker: str, quarter: str | None = None) -> dict:
-    """Run all 5 dimension scorers and return composite result."""
+def _dimension_timeout(dim_name: str, per_call: float) -> float:
+    """Seconds a dimension may run once started: per_call for each model call it may make in a row."""
+    timeout = per_call * MODEL_CALLS.get(dim_name, 1)
+    if chunked.ENABLED and dim_name in CHUNKED:
+        timeout += chunked.MAP_BUDGET + per_call
+    return timeout
+
+
+def _total_deadline(deadline: float | None, dimension_timeout: float) -> float:
+    """The scoring deadline to enforce.
+
+    None means TOTAL_DEADLINE, or the longest dimension budget in the
+    current mode if that is longer. A deadline given explicitly is a hard
+    cap and must leave room for every dimension's budget.
+    """
+    longest = max(_dimension_timeout(module.__name__.split(".")[-1], dimension_timeout)
+                  for module in SCORERS)
+    if deadline is None:
+        return max(TOTAL_DEADLINE, longest)
+    if deadline < longest:
+        raise ValueError(f"deadline of {deadline:.0f}s is shorter than the {longest:.0f}s "
+                         f"a dimension may take in this mode")
+    return deadline
+
+
+def _score_dimensions(ticker: str, filing_data: dict, max_concurrency: int,
+                      dimension_timeout: float, deadline: float, modules: list | None = None) -> dict:
+    """Run the dimension scorers (default: all) concurrently, keyed by dimension name.
+
+    Each dimension gets `dimension_timeout` per model call it may make in
+    a row (MODEL_CALLS, plus chunked mode's map phase and reduce); `deadline`
+    caps them all together. A dimension that overruns its timeout, or is still pending at the
+    deadline, is reported as unavailable; its worker thread is abandoned.
+    Dimensions waiting for a dimension slot are not yet on the clock. In fused
+    mode the 10-K dimensions share one call, and are scored separately
+    only if it fails.
+    """
+    modules = SCORERS if modules is None else modules
+    names = {module.__name__.split(".")[-1] for module in modules}
+    started: dict[str, float] = {}
+
+    def _score_one(module, dim_name):
+        # Dimensions are budgeted process-wide, so batch runs with many
+        # tickers in flight don't start clocks they can't get model time for
+        with _dimension_slots:
+            started[dim_name] = time.monotonic()
+            return {dim_name: module.score(ticker, filing_data)}
+
+    def _score_fused():
+        with _dimension_slots:
+            started["fused"] = time.monotonic()
+            return fused.score(ticker, filing_data)
+
+    results = {}
+    pool = ThreadPoolExecutor(max_workers=max(1, max_concurrency))
+    futures = {}   # future -> job name
+    members = {}   # job name -> dimensions it produces
+    timeouts = {}  # job name -> seconds allowed once started
+
+    def submit(module):
+        dim_name = module.__name__.split(".")[-1]
+        future = pool.submit(_score_one, module, dim_name)
+        futures[future] = dim_name
+        members[dim_name] = (dim_name,)
+        timeouts[dim_name] = _dimension_timeout(dim_name, dimension_timeout)
+        return future
+
+    # Fused only pays off when all of its dimensions need scoring
+    fused_dims = fused.DIMENSIONS if FUSED and names.issuperset(fused.DIMENSIONS) else ()
+    if fused_dims:
+        futures[pool.submit(_score_fused)] = "fused"
+        members["fused"] = fused_dims
+        timeouts["fused"] = dimension_timeout
+    for module in modules:
+        if module.__name__.split(".")[-1] not in fused_dims:
+            submit(module)
+    print(f"\n[{ticker}] Scoring {len(modules)} dimensions in {len(futures)} calls, "
+          f"{max(1, max_concurrency)} at a time...")
+
+    end = None
+    pending = set(futures)
+    try:
+        while pending:
+            done, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+            if end is None and started:
+                # The deadline runs from when the first model call starts,
+                # not from time spent queued for a dimension slot
+                end = min(started.values()) + deadline
+            for future in done:
+                job = futures[future]
+                try:
+                    produced = future.result()
+                except Exception as e:
+                    produced = {d: missing(d, f"Scorer error: {e}") for d in members[job]}
+                if produced is None:
+                    print(f"  [{ticker}] fused call failed — scoring {', '.join(members[job])} separately")
+                    pending.update(submit(m) for m in modules if m.__name__.split(".")[-1] in members[job])
+                    continue
+                for dim_name, result in produced.items():
+                    results[dim_name] = result
+                    status = f"Score: {result['score']}" if result["score"] is not None else "missing"
+                    print(f"  [{ticker}] {dim_name} → {status}")
+
+            now = time.monotonic()
+            for future in list(pending):
+                job = futures[future]
+                if end is not None and now >= end:
+                    reason = f"Missed {deadline:.0f}s scoring deadline"
+                elif job in started and now - started[job] >= timeouts[job]:
+                    reason = f"Timed out after {timeouts[job]:.0f}s"
+                else:
+                    continue
+                future.cancel()
+                pending.discard(future)
+                for dim_name in members[job]:
+                    results[dim_name] = missing(dim_name, reason)
+                    print(f"  [{ticker}] {dim_name} → {reason}")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # Keep SCORERS order. Results are keyed by module name, whatever
+    # "dimension" label the model echoed back
+    ordered = {}
+    for module in modules:
+        dim_name = module.__name__.split(".")[-1]
+        ordered[dim_name] = {**results[dim_name], "dimension": dim_name}
+    return ordered
+
+
+def _mode(dim_name: str) -> str:
+    """How dimension would be scored right now: "fused", "chunked" or "standard"."""
+    if FUSED and dim_name in fused.DIMENSIONS:
+        return "fused"
+    if chunked.ENABLED and dim_name in CHUNKED:
+        return "chunked"
+    return "standard"
+
+
+def _prompt_versions(module, mode: str) -> dict:
+    """Versions of the prompts a dimension scored in `mode` is built from."""
+    if mode == "fused":
+        sources = [fused]
+    elif mode == "chunked":
+        sources = [module, chunked]
+    else:
+        sources = [module]
+    return {
+        f"{source.__name__.split('.')[-1]}.{name}": value
+        for source in sources
+        for name, value in vars(source).items() if name.endswith("PROMPT_VERSION")
+    }
+
+
+def _consumed(filing_data: dict, key: str) -> list[dict]:
+    value = filing_data.get(key)
+    return value if isinstance(value, list) else ([value] if value else [])
+
+
+def _inputs_record(module, filing_data: dict, result: dict) -> dict:
+    """What a dimension was scored from: accessions per input, a hash of
+    their text, the analysis mode that produced `result` and its prompt versions."""
+    dim_name = module.__name__.split(".")[-1]
+    digest = hashlib.sha256()
+    accessions = {}
+    for key in INPUTS[dim_name]:
+        consumed = _consumed(filing_data, key)
+        accessions[key] = [f.get("accession") for f in consumed]
+        for filing in consumed:
+            digest.update(fetcher.full_text(filing).encode())
+    mode = result.get("mode", "standard")
+    return {
+        "accessions": accessions,
+        "content_sha256": digest.hexdigest(),
+        "mode": mode,
+        "prompt_versions": _prompt_versions(module, mode),
+    }
+
+
+def _previous_result(ticker: str) -> dict | None:
+    latest = history.get_latest(ticker)
+    return json.loads(latest["scores_json"]) if latest else None
+
+
+def _reusable(previous: dict, current: dict[str, list[str]]) -> dict[str, tuple[dict, dict]]:
+    """Previous (result, inputs record) for each dimension whose inputs are
+    unchanged and that was scored the way it would be scored now."""
+    reusable = {}
+    records = previous.get("inputs") or {}
+    for module in SCORERS:
+        dim_name = module.__name__.split(".")[-1]
+        prior = previous.get("dimensions", {}).get(dim_name)
+        record = records.get(dim_name)
+        if not prior or prior.get("score") is None or not record:
+            continue
+        mode = _mode(dim_name)
+        if record.get("mode") != mode or record.get("prompt_versions") != _prompt_versions(module, mode):
+            continue
+        if all(record["accessions"].get(key) == current.get(key) for key in INPUTS[dim_name]):
+            reusable[dim_name] = (prior, record)
+    # Fused dimensions are scored together or not at all: rescoring one on
+    # its own would leave it out of fused mode on every later scan
+    if FUSED and not all(dim_name in reusable for dim_name in fused.DIMENSIONS):
+        for dim_name in fused.DIMENSIONS:
+            reusable.pop(dim_name, None)
+    return reusable
+
+
+def run(ticker: str, quarter: str | None = None, max_concurrency: int = MAX_CONCURRENCY,
+        dimension_timeout: float = DIMENSION_TIMEOUT, deadline: float | None = None) -> dict:
+    """Run all 5 dimension scorers concurrently and return composite result.
+
+    Dimensions whose input filings are unchanged since the last stored scan
+    are reused unless INCREMENTAL is off. Concurrent calls for the same
+    ticker/quarter share one scan. `deadline` caps scoring as a whole (see
+    _total_deadline); a deadline too short for some dimension's budget
+    raises ValueError.
+    """
     ticker = ticker.upper()
     quarter = quarter or _current_quarter()
+    deadline = _total_deadline(deadline, dimension_timeout)
+    return _scans.do(
+        (ticker, quarter), _run, ticker, quarter, max_concurrency, dimension_timeout, deadline,
+    )
+
+
+def _run(ticker: str, quarter: str, max_concurrency: int,
+         dimension_timeout: float, deadline: float) -> dict:
 
     print(f"\n[SayVsDo] Scoring {ticker} for {quarter}")
     print("=" * 50)
 
-    # Fetch all filings
-    filing_data = fetcher.fetch_all_filings(ticker)
+    # Dimensions whose filings haven't changed since the last stored scan
+    # are carried over; only the rest are fetched and rescored
+    reused = {}
+    previous = _previous_result(ticker) if INCREMENTAL else None
+    if previous:
+        current = fetcher.current_accessions(ticker)
+        if current:
+            reused = _reusable(previous, current)
+    if reused:
+        print(f"  [{ticker}] Reusing {', '.join(reused)} — inputs unchanged since "
+              f"{previous.get('scanned_at', '')[:10]}")
+
+    modules = [m for m in SCORERS if m.__name__.split(".")[-1] not in reused]
+    needed = {key for m in modules for key in INPUTS[m.__name__.split(".")[-1]]}
+    filing_data = fetcher.fetch_all_filings(ticker, inputs=tuple(k for k in fetcher.FETCHERS if k in needed))
     company = (
         (filing_data.get("10k") or {}).get("company")
         or (filing_data.get("def14a") or {}).get("company")
+        or (previous or {}).get("company")
         or ticker
     )
 
-    # Run each dimension
-    dimension_results = {}
-    for scorer_module in SCORERS:
-        dim_name = scorer_module.__name__.split(".")[-1]
-        print(f"\n[{ticker}] Scoring: {dim_name}...")
-        result = scorer_module.score(ticker, filing_data)
-        dimension_results[result["dimension"]] = result
-        print(f"  → Score: {result['score']}")
-
-    # Composite weighted score
-    composite = 0.0
-    for dim_key, weight in WEIGHTS.items():
-        dim_score = dimension_results.get(dim_key, {}).get("score", 50)
-        composite += dim_score * weight
+    # Run each dimension that needs it
+    scored_now = _score_dimensions(
+        ticker, filing_data, max_concurrency, dimension_timeout, deadline, modules,
+    ) if modules else {}
+    dimension_results, inputs = {}, {}
+    for module in SCORERS:
+        dim_name = module.__name__.split(".")[-1]
+        if dim_name in reused:
+            dimension_results[dim_name], inputs[dim_name] = reused[dim_name]
+        else:
+            dimension_results[dim_name] = scored_now[dim_name]
+            inputs[dim_name] = _inputs_record(module, filing_data, scored_now[dim_name])
 
-    composite = round(composite)
+    # Composite weighted score, renormalized over the dimensions that scored
+    scored = {
+        dim_key: weight for dim_key, weight in WEIGHTS.items()
+        if dimension_results.get(dim_key, {}).get("score") is not None
+    }
+    missing_dims = [dim_key for dim_key in WEIGHTS if dim_key not in scored]
+    composite = None
+    if scored:
+        total = sum(dimension_results[k]["score"] * w for k, w in scored.items())
+        composite = round(total / sum(scored.values()))
 
     # Verdict
-    if composite >= 80:
+    if composite is None:
+        verdict = "Insufficient Data"
+    elif composite >= 80:
         verdict = "High Narrative Integrity"
     elif composite >= 60:
         verdict = "Moderate — Monitor"
@@ -83,6 +374,9 @@ def run(ticker: str, quarter: str | None = None) -> dict:
         "composite_score": composite,
         "verdict": verdict,
         "dimensions": dimension_results,
+        "missing_dimensions": missing_dims,
+        "reused_dimensions": list(reused),
+        "inputs": inputs,
         "scanned_at": datetime.datetime.now().isoformat(),
     }
 
@@ -0,0 +1,174 @@
+"""10-K structure — split a filing's cleaned text into its Items.
+
+Every "Item N." heading shows up at least twice: once in the table of
+contents and again where the section really starts (plus the odd
+cross-reference link, which extract turns into its own line). For each
+Item the candidate followed by the most text before the next heading is
+the real one; table-of-contents entries are a line or two long. Items
+that only appear in the table of contents fall out because real sections
+must come in Item order.
+
+Offsets are cached as <md5>.sections.json next to the cleaned text, so a
+filing is split once no matter how many dimensions ask for sections.
+
+Proxy statements have no Items; compensation_discussion() finds their
+Compensation Discussion and Analysis by its heading instead.
+"""
+
+import json
+import os
+import re
+
+from sayvdo.core import atomicfile, edgar, fetcher
+
+# Bump whenever split() changes so cached offsets are recomputed
+SPLITTER_VERSION = 1
+
+# A heading line: "Item 1A.", "ITEM 7 — MANAGEMENT'S DISCUSSION ...", "Item 9A: Controls"
+_HEADING = re.compile(r"^item[^\S\n]+(\d{1,2}[a-d]?)\b[^\S\n]*[.:\-–—]?[^\S\n]*(.*)$", re.I | re.M)
+MAX_HEADING_CHARS = 150
+
+# "Compensation Discussion and Analysis" on a line of its own, allowing a
+# short prefix or suffix ("Executive Compensation — ...", "... (CD&A)")
+_CDA_HEADING = re.compile(r"^[^\n]{0,40}compensation discussion (?:and|&) analysis[^\n]{0,40}$", re.I | re.M)
+PROSE_WORDS = 12
+
+
+def _is_heading(line: str, rest: str) -> bool:
+    # Prose like "Item 7 of this report discusses..." continues in lower case
+    return len(line) <= MAX_HEADING_CHARS and not rest[:1].islower()
+
+
+def _rank(item: str) -> tuple[int, str]:
+    return int(item.rstrip("ABCD")), item[-1] if item[-1].isalpha() else ""
+
+
+def _in_item_order(starts: list[tuple[int, str]]) -> list[tuple[int, str]]:
+    """Longest subsequence of (offset, item) pairs whose Items ascend."""
+    if not starts:
+        return []
+    length = [1] * len(starts)
+    prev = [-1] * len(starts)
+    for i in range(len(starts)):
+        for j in range(i):
+            if _rank(starts[j][1]) < _rank(starts[i][1]) and length[j] + 1 > length[i]:
+                length[i], prev[i] = length[j] + 1, j
+    i = max(range(len(starts)), key=length.__getitem__)
+    kept = []
+    while i >= 0:
+        kept.append(starts[i])
+        i = prev[i]
+    return kept[::-1]
+
+
+def split(text: str) -> dict[str, tuple[int, int]]:
+    """Map each Item found in `text` ("1", "1A", "7", ...) to its (start, end) offsets."""
+    candidates = []
+    for match in _HEADING.finditer(text):
+        if _is_heading(match.group(0), match.group(2)):
+            candidates.append((match.start(), match.group(1).upper()))
+
+    best: dict[str, tuple[int, int]] = {}
+    for i, (start, item) in enumerate(candidates):
+        span = (candidates[i + 1][0] if i + 1 < len(candidates) else len(text)) - start
+        if item not in best or span > best[item][1]:
+            best[item] = (start, span)
+
+    # Real sections appear in Item order; keep the longest run that does,
+    # which drops Items only present in the table of contents
+    starts = _in_item_order(sorted((start, item) for item, (start, _) in best.items()))
+    # Each section runs to the next real heading, so cross-reference lines
+    # inside it don't cut it short
+    return {
+        item: (start, starts[i + 1][0] if i + 1 < len(starts) else len(text))
+        for i, (start, item) in enumerate(starts)
+    }
+
+
+def _index_path(url: str) -> str:
+    return os.path.join(edgar.CACHE_DIR, fetcher._cache_key(url) + ".sections.json")
+
+
+def _read_index(url: str, length: int) -> dict | None:
+    try:
+        with open(_index_path(url)) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("version") != SPLITTER_VERSION or cached.get("length") != length:
+        return None
+    return {item: tuple(span) for item, span in cached["sections"].items()}
+
+
+def _write_index(url: str, length: int, found: dict):
+    with atomicfile.write(_index_path(url)) as f:
+        json.dump({"version": SPLITTER_VERSION, "length": length, "sections": found}, f)
+
+
+def get_sections(filing: dict) -> tuple[str, dict[str, tuple[int, int]]]:
+    """Return (full text, section offsets) for a filing dict from fetcher."""
+    text = fetcher.full_text(filing)
+    url = filing.get("url")
+    found = _read_index(url, len(text)) if url else None
+    if found is None:
+        found = split(text)
+        if url:
+            try:
+                _write_index(url, len(text), found)
+            except OSError:
+                pass
+    return text, found
+
+
+def section(filing: dict, item: str) -> str | None:
+    """Full text of one Item, or None if it wasn't found."""
+    text, found = get_sections(filing)
+    if item not in found:
+        return None
+    start, end = found[item]
+    return text[start:end]
+
+
+def excerpt(filing: dict, items: tuple[str, ...], max_chars: int) -> str | None:
+    """Text of the requested Items, in the order given, within max_chars.
+
+    The budget is shared: an Item shorter than its share leaves the rest
+    to the ones after it. Returns None when none of the Items were found.
+    """
+    text, found = get_sections(filing)
+    spans = [found[item] for item in items if item in found]
+    if not spans:
+        return None
+
+    parts = []
+    remaining = max_chars
+    for i, (start, end) in enumerate(spans):
+        share = remaining // (len(spans) - i)
+        part = text[start:min(end, start + share)]
+        parts.append(part)
+        remaining -= len(part)
+    return "\n\n".join(parts)
+
+
+def _prose_share(text: str) -> float:
+    """Fraction of text in lines long enough to be prose rather than headings or entries."""
+    lines = text.splitlines()
+    total = sum(len(line) for line in lines)
+    if not total:
+        return 0.0
+    return sum(len(line) for line in lines if len(line.split()) >= PROSE_WORDS) / total
+
+
+def compensation_discussion(filing: dict, max_chars: int) -> str | None:
+    """A proxy statement's Compensation Discussion and Analysis, within max_chars.
+
+    The table of contents (and running page heads) repeat the heading; the
+    real one is the first followed by prose rather than more short lines.
+    Returns None when no such heading is found.
+    """
+    text = fetcher.full_text(filing)
+    for match in _CDA_HEADING.finditer(text):
+        following = text[match.end():match.end() + 5000].strip().splitlines()[:10]
+        if _prose_share("\n".join(following)) >= 0.5:
+            return text[match.start():match.start() + max_chars]
+    return None
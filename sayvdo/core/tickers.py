@@ -0,0 +1,134 @@
+"""Ticker directory — O(1) ticker/CIK/company lookups.
+
+SEC's company_tickers.json (~10k entries) is loaded once per process into
+dicts keyed by ticker and by CIK. The raw file is snapshotted next to the
+filing cache and revalidated with a conditional GET once the TTL expires, so
+a warm directory makes no network calls at all.
+"""
+
+import json
+import os
+import threading
+import time
+
+import requests
+
+from sayvdo.core import atomicfile, edgar
+
+TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+TTL_SECONDS = 24 * 60 * 60
+
+_lock = threading.Lock()
+_by_ticker: dict[str, dict] = {}
+_by_cik: dict[str, dict] = {}
+_checked_at = 0.0
+
+
+def _paths() -> tuple[str, str]:
+    return (
+        os.path.join(edgar.CACHE_DIR, "company_tickers.json"),
+        os.path.join(edgar.CACHE_DIR, "company_tickers.meta.json"),
+    )
+
+
+def _read_json(path: str) -> dict | None:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: str, data: dict):
+    with atomicfile.write(path) as f:
+        json.dump(data, f)
+
+
+def _normalize(ticker: str) -> str:
+    # EDGAR spells share classes with a dash (BRK-B), users often type BRK.B
+    return ticker.strip().upper().replace(".", "-")
+
+
+def _build(raw: dict):
+    global _by_ticker, _by_cik
+    by_ticker, by_cik = {}, {}
+    for entry in raw.values():
+        ticker = _normalize(entry.get("ticker", ""))
+        if not ticker:
+            continue
+        record = {
+            "ticker": ticker,
+            "cik": str(entry["cik_str"]),
+            "title": entry.get("title", ticker),
+        }
+        by_ticker.setdefault(ticker, record)
+        # The file lists a company's primary ticker first
+        by_cik.setdefault(record["cik"], record)
+    _by_ticker, _by_cik = by_ticker, by_cik
+
+
+def _revalidate(snapshot: dict | None, meta: dict) -> tuple[dict, dict]:
+    """Conditional GET against EDGAR. Returns (raw, meta)."""
+    headers = {}
+    if snapshot is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    resp = edgar.get(TICKERS_URL, headers=headers)
+    if resp.status_code == 304 and snapshot is not None:
+        return snapshot, {**meta, "fetched_at": time.time()}
+    resp.raise_for_status()
+    return resp.json(), {
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "fetched_at": time.time(),
+    }
+
+
+def _ensure_loaded():
+    global _checked_at
+    if _by_ticker and time.time() - _checked_at < TTL_SECONDS:
+        return
+
+    with _lock:
+        if _by_ticker and time.time() - _checked_at < TTL_SECONDS:
+            return
+
+        snapshot_path, meta_path = _paths()
+        snapshot = _read_json(snapshot_path)
+        meta = _read_json(meta_path) or {}
+        fresh = time.time() - meta.get("fetched_at", 0) < TTL_SECONDS
+
+        if snapshot is not None and fresh:
+            raw = snapshot
+        else:
+            try:
+                raw, meta = _revalidate(snapshot, meta)
+            except (requests.RequestException, ValueError) as e:
+                if snapshot is None:
+                    raise
+                print(f"  [tickers] Revalidation failed ({e}) — using stale snapshot")
+                raw = snapshot
+            else:
+                if raw is not snapshot:
+                    _write_json(snapshot_path, raw)
+                _write_json(meta_path, meta)
+
+        if raw is not snapshot or not _by_ticker:
+            _build(raw)
+        _checked_at = time.time()
+
+
+def lookup(ticker: str) -> dict | None:
+    """Return {"ticker", "cik", "title"} for a ticker symbol, or None."""
+    _ensure_loaded()
+    return _by_ticker.get(_normalize(ticker))
+
+
+def lookup_cik(cik: str | int) -> dict | None:
+    """Return the directory entry for a CIK (leading zeros optional), or None."""
+    _ensure_loaded()
+    return _by_cik.get(str(int(cik)))
+
@@ -0,0 +1,146 @@
+"""Bulk score export/import — NDJSON, CSV and Parquet.
+
+Rows come from history.iter_scores, a streaming cursor, and are written as
+they arrive, so exporting the whole table uses constant memory. Imports
+go through history.import_scores: batched executemany in one transaction.
+
+NDJSON rows embed the full result as a `result` object; CSV and Parquet
+keep it as the `scores_json` string column. Parquet needs the optional
+`pyarrow` package.
+"""
+
+import csv
+import json
+import os
+import sys
+
+from sayvdo.core import history
+
+FORMATS = ("ndjson", "csv", "parquet")
+
+INT_COLUMNS = {
+    "composite_score", "ai_score", "guidance_score", "risk_drift_score", "capital_score", "esg_score",
+}
+
+
+def detect_format(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower().lstrip(".")
+    fmt = {"jsonl": "ndjson", "json": "ndjson", "pq": "parquet"}.get(ext, ext)
+    if fmt not in FORMATS:
+        raise ValueError(f"Can't tell format of {path}; pass one of {', '.join(FORMATS)}")
+    return fmt
+
+
+def ndjson_line(row: dict) -> str:
+    """One NDJSON line; the stored result JSON is spliced in without re-parsing."""
+    meta = {k: v for k, v in row.items() if k != "scores_json"}
+    head = json.dumps(meta, ensure_ascii=False)
+    result = row.get("scores_json") or "null"
+    return f'{head[:-1]}, "result": {result}}}\n'
+
+
+def iter_ndjson_chunks(rows, lines_per_chunk: int = 500):
+    """Group NDJSON lines into chunks for a streaming HTTP response."""
+    chunk = []
+    for row in rows:
+        chunk.append(ndjson_line(row))
+        if len(chunk) >= lines_per_chunk:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def write_ndjson(rows, f) -> int:
+    count = 0
+    for chunk in iter_ndjson_chunks(rows):
+        f.write(chunk)
+        count += chunk.count("\n")
+    return count
+
+
+def write_csv(rows, f) -> int:
+    writer = csv.DictWriter(f, fieldnames=history.EXPORT_COLUMNS)
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise RuntimeError("Parquet support needs pyarrow: pip install 'sayvdo[parquet]'")
+    return pyarrow
+
+
+def _parquet_schema(pa):
+    return pa.schema([
+        (col, pa.int64() if col in INT_COLUMNS else pa.string())
+        for col in history.EXPORT_COLUMNS
+    ])
+
+
+def write_parquet(rows, path: str, row_group_size: int = 5000) -> int:
+    pa = _require_pyarrow()
+    schema = _parquet_schema(pa)
+    count = 0
+    with pa.parquet.ParquetWriter(path, schema) as writer:
+        batch = []
+
+        def flush():
+            columns = {col: [r.get(col) for r in batch] for col in history.EXPORT_COLUMNS}
+            writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= row_group_size:
+                flush()
+                count += len(batch)
+                batch = []
+        if batch:
+            flush()
+            count += len(batch)
+    return count
+
+
+def export_scores(path: str | None, fmt: str, **filters) -> int:
+    """Write filtered scores to `path` (stdout when None). Returns row count."""
+    rows = history.iter_scores(**filters)
+    if fmt == "parquet":
+        if not path:
+            raise ValueError("Parquet export needs an output file")
+        return write_parquet(rows, path)
+
+    writer = write_ndjson if fmt == "ndjson" else write_csv
+    if not path:
+        return writer(rows, sys.stdout)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        return writer(rows, f)
+
+
+def read_rows(path: str, fmt: str):
+    """Yield EXPORT_COLUMNS dicts from an export file."""
+    if fmt == "ndjson":
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    row = json.loads(line)
+                    if "result" in row:
+                        row["scores_json"] = row.pop("result")
+                    yield row
+    elif fmt == "csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    else:
+        pa = _require_pyarrow()
+        for batch in pa.parquet.ParquetFile(path).iter_batches():
+            yield from batch.to_pylist()
+
+
+def import_scores(path: str, fmt: str) -> int:
+    return history.import_scores(read_rows(path, fmt))
@@ -0,0 +1,103 @@
+"""Background scoring jobs for the web tier.
+
+A scan takes minutes, so HTTP handlers submit it here and return a job id
+straight away. Jobs run in a small worker pool; a request for a
+ticker/quarter that is already queued or running is attached to the
+in-flight job instead of starting a second scan.
+"""
+
+import datetime
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from sayvdo.core import scorer, history
+from sayvdo.worklog import log_scan
+
+MAX_WORKERS = 2
+JOB_TTL_SECONDS = 60 * 60  # finished jobs stay queryable this long
+
+_lock = threading.Lock()
+_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="sayvdo-job")
+_jobs: dict[str, dict] = {}
+_inflight: dict[tuple[str, str], str] = {}
+
+
+def _now() -> str:
+    return datetime.datetime.now().isoformat()
+
+
+def _view(job: dict) -> dict:
+    view = {k: v for k, v in job.items() if not k.startswith("_")}
+    view["status_url"] = f"/jobs/{job['job_id']}"
+    return view
+
+
+def _prune():
+    cutoff = time.time() - JOB_TTL_SECONDS
+    for job_id in [j for j, job in _jobs.items()
+                   if job["status"] in ("done", "failed") and job["_finished"] < cutoff]:
+        del _jobs[job_id]
+
+
+def _run(job_id: str):
+    with _lock:
+        job = _jobs[job_id]
+        job["status"] = "running"
+        job["started_at"] = _now()
+    try:
+        result = scorer.run(job["ticker"], quarter=job["quarter"])
+        if result["composite_score"] is None:
+            # Keep the last good score rather than saving an empty one
+            raise RuntimeError("No dimension could be scored; try again later")
+        history.save_score(result)
+        log_scan(job["ticker"], result["composite_score"], result["quarter"])
+    except Exception as e:
+        with _lock:
+            job.update(status="failed", error=str(e))
+    else:
+        with _lock:
+            job.update(status="done", result=result)
+    finally:
+        with _lock:
+            job["finished_at"] = _now()
+            job["_finished"] = time.time()
+            _inflight.pop((job["ticker"], job["quarter"]), None)
+
+
+def submit(ticker: str, quarter: str | None = None) -> dict:
+    """Queue a scan, or return the in-flight job for the same ticker/quarter."""
+    ticker = ticker.upper()
+    quarter = quarter or scorer._current_quarter()
+    key = (ticker, quarter)
+    with _lock:
+        _prune()
+        job_id = _inflight.get(key)
+        if job_id:
+            return _view(_jobs[job_id])
+
+        job_id = uuid.uuid4().hex
+        job = {
+            "job_id": job_id,
+            "ticker": ticker,
+            "quarter": quarter,
+            "status": "queued",
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+            "result": None,
+            "error": None,
+        }
+        _jobs[job_id] = job
+        _inflight[key] = job_id
+        view = _view(job)
+    _pool.submit(_run, job_id)
+    return view
+
+
+def get(job_id: str) -> dict | None:
+    """Current status (and result, once done) of a job."""
+    with _lock:
+        job = _jobs.get(job_id)
+        return _view(job) if job else None
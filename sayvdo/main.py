@@ -1,77 +1,174 @@
 """FastAPI web app for Say vs. Do."""
 
+import datetime
+import email.utils
+import hashlib
 import json
-from fastapi import FastAPI, Request, Form, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import FastAPI, Request, Form, HTTPException, Query
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.templating import Jinja2Templates
 import os
 
-from sayvdo.core import scorer, history
-from sayvdo.worklog import log_scan
+from sayvdo import export, jobs
+from sayvdo.core import history, llm
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 templates = Jinja2Templates(directory=os.path.join(BASE_DIR, "templates"))
 
 app = FastAPI(title="Say vs. Do", version="1.0.0")
 
+# Scores change at most once per scan, so let clients and proxies cache
+# briefly and revalidate with ETag/Last-Modified after that
+CACHE_CONTROL = os.environ.get("SAYVDO_CACHE_CONTROL", "public, max-age=60, must-revalidate")
+
+
+def _http_date(scanned_at: str | None) -> str | None:
+    """scanned_at (naive local ISO time) as an HTTP-date, or None."""
+    try:
+        dt = datetime.datetime.fromisoformat(scanned_at)
+    except (TypeError, ValueError):
+        return None
+    return email.utils.format_datetime(dt.astimezone(datetime.timezone.utc), usegmt=True)
+
+
+def _parse_http_date(value: str | None) -> datetime.datetime:
+    try:
+        return email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+
+
+def _validators(rows: list[dict]) -> dict:
+    """ETag/Last-Modified/Cache-Control headers for responses built from `rows`."""
+    version = "|".join(f"{r['ticker']}:{r['id']}:{r['scanned_at']}" for r in rows)
+    headers = {
+        "ETag": '"' + hashlib.sha256(version.encode()).hexdigest()[:32] + '"',
+        "Cache-Control": CACHE_CONTROL,
+    }
+    last_modified = max((_http_date(r["scanned_at"]) for r in rows), key=_parse_http_date, default=None)
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    return headers
+
+
+def _not_modified(request: Request, headers: dict) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match wins over If-Modified-Since (RFC 9110 13.2.2)
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        return "*" in tags or headers["ETag"] in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and "Last-Modified" in headers:
+        return _parse_http_date(headers["Last-Modified"]) <= _parse_http_date(if_modified_since)
+    return False
+
+
+def _conditional(request: Request, rows: list[dict], build) -> Response:
+    """304 if the client's copy of `rows` is current, else build() with validators."""
+    headers = _validators(rows)
+    if _not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    response = build()
+    response.headers.update(headers)
+    return response
+
 
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
-    tickers = history.get_all_tickers()
-    recent = []
-    for t in tickers[:12]:
-        row = history.get_latest(t)
-        if row:
-            recent.append(row)
-    recent.sort(key=lambda r: r.get("composite_score", 0), reverse=True)
+    # The 12 most recently scanned tickers, best score first
+    recent = history.get_leaderboard(sort="scanned_at", limit=12)
+    recent.sort(key=lambda r: r.get("composite_score") or 0, reverse=True)
     return templates.TemplateResponse("index.html", {"request": request, "recent": recent})
 
 
 @app.get("/score/{ticker}", response_class=HTMLResponse)
 async def score_page(request: Request, ticker: str):
     ticker = ticker.upper()
-    # Check for cached result
-    latest = history.get_latest(ticker)
     hist = history.get_history(ticker)
-    if latest:
-        result = json.loads(latest["scores_json"])
-    else:
-        result = None
-    return templates.TemplateResponse("report.html", {
-        "request": request,
-        "ticker": ticker,
-        "result": result,
-        "history": hist,
-    })
+
+    def render():
+        # Check for cached result
+        latest = history.get_latest(ticker)
+        if latest:
+            result = json.loads(latest["scores_json"])
+        else:
+            result = None
+        return templates.TemplateResponse("report.html", {
+            "request": request,
+            "ticker": ticker,
+            "result": result,
+            "history": hist,
+        })
+
+    if not hist:
+        return render()
+    return _conditional(request, hist, render)
 
 
 @app.post("/score/{ticker}")
 async def run_score(ticker: str):
-    ticker = ticker.upper()
-    result = scorer.run(ticker)
-    history.save_score(result)
-    log_scan(ticker, result["composite_score"], result["quarter"])
-    return JSONResponse(result)
+    # Scans take minutes — queue one and let the client poll /jobs/{id}
+    return JSONResponse(jobs.submit(ticker), status_code=202)
 
 
 @app.get("/api/score/{ticker}")
-async def api_score(ticker: str, fresh: bool = False):
+async def api_score(request: Request, ticker: str, fresh: bool = False):
     ticker = ticker.upper()
     if not fresh:
-        latest = history.get_latest(ticker)
+        latest = history.get_latest_payload(ticker)
         if latest:
-            return JSONResponse(json.loads(latest["scores_json"]))
-    result = scorer.run(ticker)
-    history.save_score(result)
-    log_scan(ticker, result["composite_score"], result["quarter"])
-    return JSONResponse(result)
+            return _conditional(
+                request, [{"ticker": ticker, **latest}],
+                lambda: Response(content=latest["payload"], media_type="application/json"),
+            )
+    return JSONResponse(jobs.submit(ticker), status_code=202)
+
+
+@app.get("/jobs/{job_id}")
+async def job_status(job_id: str):
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    return JSONResponse(job)
 
 
 @app.get("/api/history/{ticker}")
-async def api_history(ticker: str):
-    return JSONResponse(history.get_history(ticker.upper()))
+async def api_history(request: Request, ticker: str):
+    rows = history.get_history(ticker.upper())
+    if not rows:
+        return JSONResponse(rows)
+    return _conditional(request, rows, lambda: JSONResponse(rows))
+
+
+@app.get("/leaderboard")
+async def leaderboard(sort: str = "composite_score", order: str = "desc",
+                      limit: int = Query(20, ge=1, le=500), offset: int = Query(0, ge=0)):
+    """Latest score per ticker, ranked by composite or any dimension."""
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'")
+    try:
+        rows = history.get_leaderboard(sort=sort, descending=order == "desc",
+                                       limit=limit, offset=offset)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return JSONResponse({
+        "sort": sort,
+        "order": order,
+        "limit": limit,
+        "offset": offset,
+        "total": history.count_tickers(),
+        "rows": rows,
+    })
+
+
+@app.get("/api/export.ndjson")
+async def api_export(ticker: str | None = None, quarter: str | None = None,
+                     since: str | None = None, until: str | None = None):
+    """Stream every matching score row as NDJSON (`until` is exclusive)."""
+    rows = history.iter_scores(ticker=ticker, quarter=quarter, since=since, until=until)
+    return StreamingResponse(export.iter_ndjson_chunks(rows), media_type="application/x-ndjson")
 
 
 @app.get("/health")
 async def health():
-    return {"status": "ok", "service": "sayvdo"}
+    return {"status": "ok", "service": "sayvdo", "history_cache": history.cache_stats(), "llm": llm.stats()}
@@ -0,0 +1,50 @@
+import pytest
+
+from sayvdo.core import extract
+
+HTML = """<!DOCTYPE html>
+<html><head><title>Form 10-K</title>
+<style>p { margin: 0 }</style>
+<script>var x = "<p>not text</p>";</script>
+</head><body>
+<!-- generated by a filing agent -->
+<h2>Item 1A. Risk Factors</h2>
+<p>Our results depend on <b>AI</b>&nbsp;adoption &amp; demand.<br>Competition is intense.</p>
+<table><tr><td>Revenue</td><td>$ 1,234</td></tr><tr><td>Net&#160;income</td><td>567</td></tr></table>
+<p>__________________________</p>
+<ul><li>First risk<li>Second risk</ul>
+<img src="chart.png"><hr>
+<div>Unclosed <span>inline text</div>
+<p>Last paragraph.</p>
+</body></html>
+"""
+
+IXBRL = """<html xmlns="http://www.w3.org/1999/xhtml" xmlns:ix="http://www.xbrl.org/2013/inlineXBRL">
+<body>
+<div style="display:none"><ix:header><ix:hidden><ix:nonNumeric name="dei:DocumentType">10-K</ix:nonNumeric>
+</ix:hidden><ix:references><link:schemaRef href="x.xsd"/></ix:references></ix:header></div>
+<p>Revenue was $<ix:nonFraction name="us-gaap:Revenues" unitRef="usd" decimals="-6">1,234</ix:nonFraction> million.</p>
+<p>We invest in <span>artificial intelligence</span> across products.</p>
+<p>Total: <ix:nonFraction name="us-gaap:NetIncomeLoss" unitRef="usd" decimals="-6"><span>567</span></ix:nonFraction></p>
+<p>Fiscal year <ix:nonNumeric name="dei:DocumentFiscalYearFocus">2025</ix:nonNumeric> closed.</p>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize("html", [HTML, IXBRL], ids=["html", "ixbrl"])
+@pytest.mark.parametrize("engine", extract.available_engines())
+def test_engines_match_the_bs4_reference(engine, html):
+    assert extract.extract_text(html, engine) == extract.extract_text(html, "bs4")
+
+
+def test_ixbrl_facts_and_header_are_dropped():
+    text = extract.extract_text(IXBRL, "bs4")
+    assert "artificial intelligence" in text
+    assert "1,234" not in text
+    assert "dei:DocumentType" not in text and "10-K" not in text
+
+
+def test_lxml_listed_only_when_installed():
+    engines = extract.available_engines()
+    assert "stream" in engines and "bs4" in engines
+    assert ("lxml" in engines) == (extract.etree is not None)
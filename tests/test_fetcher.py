@@ -0,0 +1,63 @@
+from sayvdo.core import fetcher, filings
+
+
+def _index_page(rows: list[tuple[str, str, str]]) -> str:
+    """An EDGAR -index.htm documents table: (description, href, type) per row."""
+    body = "".join(
+        f'<tr><td>{seq}</td><td>{description}</td><td><a href="{href}">{href.rsplit("/", 1)[-1]}</a></td>'
+        f"<td>{doc_type}</td><td>12345</td></tr>"
+        for seq, (description, href, doc_type) in enumerate(rows, 1)
+    )
+    return f"<table><tr><th>Seq</th><th>Description</th><th>Document</th><th>Type</th></tr>{body}</table>"
+
+
+def test_find_exhibit_prefers_ex_99_1():
+    page = _index_page([
+        ("Current report", "/Archives/edgar/data/1/0001/form8-k.htm", "8-K"),
+        ("Investor presentation", "/Archives/edgar/data/1/0001/ex99-2.htm", "EX-99.2"),
+        ("Press release", "/Archives/edgar/data/1/0001/ex99-1.htm", "EX-99.1"),
+    ])
+    assert fetcher._find_exhibit(page) == "/Archives/edgar/data/1/0001/ex99-1.htm"
+
+
+def test_find_exhibit_reads_the_type_column_not_the_description():
+    page = _index_page([
+        ("Cover page, see EX-99.1", "/Archives/edgar/data/1/0001/form8-k.htm", "8-K"),
+        ("Press release", "/Archives/edgar/data/1/0001/ex99.htm", "EX-99"),
+    ])
+    assert fetcher._find_exhibit(page) == "/Archives/edgar/data/1/0001/ex99.htm"
+
+
+def test_find_exhibit_strips_the_inline_viewer_prefix():
+    page = _index_page([("Press release", "/ix?doc=/Archives/edgar/data/1/0001/ex991.htm", "EX-99.1")])
+    assert fetcher._find_exhibit(page) == "/Archives/edgar/data/1/0001/ex991.htm"
+
+
+def test_find_exhibit_is_none_without_an_ex_99():
+    page = _index_page([("Current report", "/Archives/edgar/data/1/0001/form8-k.htm", "8-K")])
+    assert fetcher._find_exhibit(page) is None
+
+
+def _index(rows: list[tuple[str, str, str]]) -> filings.FilingIndex:
+    recent = {
+        "form": [form for form, _, _ in rows],
+        "filingDate": [date for _, date, _ in rows],
+        "accessionNumber": [f"0000000001-25-{i:06d}" for i in range(len(rows))],
+        "primaryDocument": ["doc.htm"] * len(rows),
+        "items": [items for _, _, items in rows],
+    }
+    return filings.FilingIndex("1", {"filings": {"recent": recent}})
+
+
+def test_select_8ks_keeps_only_earnings_releases():
+    index = _index([
+        ("8-K", fetcher._since(10), "5.02"),
+        ("8-K", fetcher._since(40), "2.02,9.01"),
+        ("8-K", fetcher._since(130), "2.02,9.01"),
+    ])
+    assert [f["items"] for f in fetcher._select_8ks(index)] == ["2.02,9.01", "2.02,9.01"]
+
+
+def test_select_8ks_is_empty_without_earnings_releases():
+    index = _index([("8-K", fetcher._since(10), "5.02"), ("8-K", fetcher._since(50), "5.07")])
+    assert fetcher._select_8ks(index) == []
@@ -0,0 +1,88 @@
+import pytest
+
+from sayvdo.core import edgar, filings
+
+
+def _rows(*filings_: tuple[str, str, str]) -> dict:
+    """Submissions columns for (form, filingDate, items) rows, newest first."""
+    return {
+        "form": [form for form, _, _ in filings_],
+        "filingDate": [date for _, date, _ in filings_],
+        "reportDate": ["" for _ in filings_],
+        "accessionNumber": [f"0000000001-{date[2:4]}-{n:06d}" for n, (_, date, _) in enumerate(filings_)],
+        "primaryDocument": ["doc.htm" for _ in filings_],
+        "items": [items for _, _, items in filings_],
+    }
+
+
+# Three pages of history: `recent` plus two older files, listed out of order
+PAGES = {
+    "CIK0000000001-submissions-001.json": _rows(
+        ("10-K", "2022-02-01", ""),
+        ("8-K", "2021-10-20", "2.02,9.01"),
+    ),
+    "CIK0000000001-submissions-002.json": _rows(
+        ("10-K", "2019-02-01", ""),
+        ("8-K", "2018-10-20", "2.02"),
+    ),
+}
+SUBMISSIONS = {
+    "filings": {
+        "recent": _rows(
+            ("8-K", "2025-10-22", "2.02,9.01"),
+            ("10-Q", "2025-07-30", ""),
+            ("8-K", "2025-05-01", "5.07"),
+            ("10-K", "2025-02-01", ""),
+        ),
+        "files": [
+            {"name": "CIK0000000001-submissions-002.json", "filingFrom": "2018-01-01", "filingTo": "2019-12-31"},
+            {"name": "CIK0000000001-submissions-001.json", "filingFrom": "2020-01-01", "filingTo": "2022-12-31"},
+        ],
+    },
+}
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    names = []
+
+    def get_json(url):
+        name = url.rsplit("/", 1)[-1]
+        names.append(name)
+        return PAGES[name]
+
+    monkeypatch.setattr(edgar, "get_json", get_json)
+    return names
+
+
+def test_find_stays_in_recent_when_limit_is_met(fetched):
+    index = filings.FilingIndex("1", SUBMISSIONS)
+    found = index.find("8-K", limit=1, item="2.02")
+    assert [f["date"] for f in found] == ["2025-10-22"]
+    assert fetched == []
+
+
+def test_find_pages_through_history_newest_first(fetched):
+    index = filings.FilingIndex("1", SUBMISSIONS)
+    found = index.find("10-K")
+    assert [f["date"] for f in found] == ["2025-02-01", "2022-02-01", "2019-02-01"]
+    assert fetched == ["CIK0000000001-submissions-001.json", "CIK0000000001-submissions-002.json"]
+    assert found[1]["url"] == (
+        "https://www.sec.gov/Archives/edgar/data/1/000000000122000000/doc.htm"
+    )
+
+
+def test_find_stops_paging_at_since(fetched):
+    index = filings.FilingIndex("1", SUBMISSIONS)
+    found = index.find("8-K", item="2.02", since="2020-01-01")
+    assert [f["date"] for f in found] == ["2025-10-22", "2021-10-20"]
+    # The 2018 page is past the cutoff and never fetched
+    assert fetched == ["CIK0000000001-submissions-001.json"]
+
+
+def test_find_reuses_loaded_pages(fetched):
+    index = filings.FilingIndex("1", SUBMISSIONS)
+    index.find("10-K", since="2021-01-01")
+    found = index.find("8-K", item="2.02", since="2021-01-01")
+    assert [f["date"] for f in found] == ["2025-10-22", "2021-10-20"]
+    assert fetched == ["CIK0000000001-submissions-001.json"]
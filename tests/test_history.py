@@ -0,0 +1,104 @@
+import json
+
+import pytest
+
+from sayvdo import export
+from sayvdo.cache.lru import LRUCache
+from sayvdo.core import history
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "DB_PATH", str(tmp_path / "sayvdo.db"))
+    monkeypatch.setattr(history, "_hot", LRUCache(64, 1024 * 1024))
+    return tmp_path
+
+
+def _result(ticker: str, quarter: str, scanned_at: str, score: int) -> dict:
+    return {
+        "ticker": ticker,
+        "company": f"{ticker} Inc.",
+        "quarter": quarter,
+        "composite_score": score,
+        "verdict": "Mostly consistent",
+        "dimensions": {"ai_narrative": {"score": score, "evidence": ["said it"], "flags": []}},
+        "scanned_at": scanned_at,
+    }
+
+
+def _snapshot() -> list[dict]:
+    return list(history.iter_scores())
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "csv"])
+def test_export_import_round_trip(db, monkeypatch, fmt):
+    history.save_scores([
+        _result("AAA", "Q3-2025", "2025-10-01T00:00:00", 70),
+        _result("AAA", "Q4-2025", "2026-01-15T00:00:00", 74),
+        _result("BBB", "Q4-2025", "2026-01-20T00:00:00", 55),
+    ])
+    before = _snapshot()
+    path = str(db / f"scores.{fmt}")
+    assert export.export_scores(path, fmt) == 3
+
+    monkeypatch.setattr(history, "DB_PATH", str(db / "restored.db"))
+    assert export.import_scores(path, fmt) == 3
+
+    assert _snapshot() == before
+    latest = history.get_latest_payload("AAA")
+    assert json.loads(latest["payload"])["quarter"] == "Q4-2025"
+
+
+def test_import_rejects_a_row_without_scores_json(db):
+    history.save_score(_result("AAA", "Q4-2025", "2026-01-15T00:00:00", 74))
+    rows = [
+        {"ticker": "bbb", "quarter": "Q4-2025", "composite_score": 60,
+         "scanned_at": "2026-01-20T00:00:00", "scores_json": json.dumps({"ticker": "BBB"})},
+        {"ticker": "ccc", "quarter": "Q4-2025", "composite_score": 50,
+         "scanned_at": "2026-01-21T00:00:00", "scores_json": ""},
+    ]
+    with pytest.raises(ValueError, match="CCC"):
+        history.import_scores(rows)
+
+    # Nothing from the file was written
+    assert [row["ticker"] for row in _snapshot()] == ["AAA"]
+
+
+def test_batch_writer_drains_the_queue_on_close(db):
+    writer = history.BatchWriter(max_rows=1000, flush_interval=60)
+    for n in range(5):
+        writer.save(_result(f"T{n}", "Q4-2025", "2026-01-15T00:00:00", 60 + n))
+    # Neither threshold was reached, so nothing has been committed yet
+    assert _snapshot() == []
+
+    writer.close()
+    assert writer.written == 5
+    assert [row["ticker"] for row in _snapshot()] == ["T0", "T1", "T2", "T3", "T4"]
+
+
+def test_batch_writer_commits_saves_after_close_directly(db):
+    with history.BatchWriter(max_rows=1000, flush_interval=60) as writer:
+        writer.save(_result("AAA", "Q4-2025", "2026-01-15T00:00:00", 74))
+
+    # e.g. a scan finishing after the batch run was interrupted
+    writer.save(_result("BBB", "Q4-2025", "2026-01-20T00:00:00", 55))
+    assert writer.written == 2
+    assert [row["ticker"] for row in _snapshot()] == ["AAA", "BBB"]
+
+    # Neither blocks once the writer thread has exited
+    writer.flush()
+    writer.close()
+
+
+def test_rescan_with_an_older_scanned_at_keeps_latest_pointing_at_a_row(db):
+    history.save_score(_result("AAA", "Q3-2025", "2025-10-01T00:00:00", 70))
+    history.save_score(_result("AAA", "Q4-2025", "2026-01-15T00:00:00", 74))
+    # Same ticker/quarter replaced with an older timestamp, e.g. a
+    # back-filled scan — the Q4 row latest_scores mirrored is gone
+    history.save_score(_result("AAA", "Q4-2025", "2025-09-01T00:00:00", 40))
+
+    latest = history.get_latest("AAA")
+    ids = {row["id"] for row in history._conn().execute("SELECT id FROM scores WHERE ticker = 'AAA'")}
+    assert latest["id"] in ids
+    assert latest["quarter"] == "Q3-2025" and latest["composite_score"] == 70
+    assert json.loads(history.get_latest_payload("AAA")["payload"])["quarter"] == "Q3-2025"
@@ -0,0 +1,63 @@
+import time
+
+from sayvdo.cache.lru import LRUCache
+
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = LRUCache(max_entries=2, max_bytes=1000)
+    cache.put("a", 1, 1)
+    cache.put("b", 2, 1)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3, 1)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_byte_limit_evicts_and_oversized_values_are_not_stored():
+    cache = LRUCache(max_entries=10, max_bytes=10)
+    cache.put("a", "x", 6)
+    cache.put("b", "y", 6)
+    assert cache.get("a") is None and cache.get("b") == "y"
+    cache.put("huge", "z", 11)
+    assert cache.get("huge") is None and cache.get("b") == "y"
+
+
+def test_entries_expire_after_ttl():
+    cache = LRUCache(max_entries=10, max_bytes=100, ttl=0.05)
+    cache.put("a", 1, 1)
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("a") is None
+
+
+def test_invalidate_tag_drops_only_that_tags_entries():
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    cache.put(("latest", "AAPL"), 1, 1, tag="AAPL")
+    cache.put(("history", "AAPL"), 2, 1, tag="AAPL")
+    cache.put(("latest", "MSFT"), 3, 1, tag="MSFT")
+    cache.invalidate_tag("AAPL")
+    assert cache.get(("latest", "AAPL")) is None
+    assert cache.get(("history", "AAPL")) is None
+    assert cache.get(("latest", "MSFT")) == 3
+    assert cache.stats()["bytes"] == 1
+
+
+def test_value_read_before_an_invalidation_is_not_cached():
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    generation = cache.generation("AAPL")
+    cache.invalidate_tag("AAPL")  # a write lands while the reader is loading
+    cache.put("k", "stale", 1, tag="AAPL", generation=generation)
+    assert cache.get("k") is None
+
+    cache.put("k", "fresh", 1, tag="AAPL", generation=cache.generation("AAPL"))
+    assert cache.get("k") == "fresh"
+
+
+def test_stats_count_hits_and_misses():
+    cache = LRUCache(max_entries=10, max_bytes=100)
+    cache.put("a", 1, 1)
+    cache.get("a")
+    cache.get("missing")
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
@@ -0,0 +1,57 @@
+import threading
+import time
+
+from sayvdo.core.ratelimit import TokenBucket
+
+TOLERANCE = 0.9  # sleep granularity
+
+
+def _acquire_times(bucket: TokenBucket, n: int) -> list[float]:
+    times = []
+    for _ in range(n):
+        bucket.acquire()
+        times.append(time.monotonic())
+    return times
+
+
+def test_requests_are_spaced_by_the_rate():
+    times = _acquire_times(TokenBucket(rate=50), 6)
+    gaps = [b - a for a, b in zip(times, times[1:])]
+    assert min(gaps) >= 0.02 * TOLERANCE
+
+
+def test_burst_lets_requests_through_back_to_back():
+    bucket = TokenBucket(rate=10, burst=3)
+    start = time.monotonic()
+    _acquire_times(bucket, 3)
+    assert time.monotonic() - start < 0.05
+    bucket.acquire()  # the fourth waits for a token
+    assert time.monotonic() - start >= 0.1 * TOLERANCE
+
+
+def test_concurrent_callers_are_spaced():
+    bucket = TokenBucket(rate=50)
+    times, lock = [], threading.Lock()
+
+    def worker():
+        bucket.acquire()
+        with lock:
+            times.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    times.sort()
+    assert times[-1] - times[0] >= 5 * 0.02 * TOLERANCE
+
+
+def test_buckets_sharing_a_state_file_share_one_budget(tmp_path):
+    # Two buckets on one state file stand in for two processes
+    path = str(tmp_path / "rate.state")
+    a, b = TokenBucket(rate=20, state_path=path), TokenBucket(rate=20, state_path=path)
+    start = time.monotonic()
+    for bucket in (a, b, a, b, a):
+        bucket.acquire()
+    assert time.monotonic() - start >= 4 * 0.05 * TOLERANCE
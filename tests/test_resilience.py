@@ -0,0 +1,149 @@
+import time
+
+import pytest
+
+from sayvdo.core.resilience import CallPolicy, CircuitBreaker, CircuitOpenError, UnusableResponse
+
+
+def _failing(error=RuntimeError("down")):
+    def fn(timeout):
+        raise error
+    return fn
+
+
+# CircuitBreaker
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_lets_a_single_probe_through():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    assert breaker.state == "half-open"
+    breaker.before_call()  # the probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_successful_probe_closes_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=0.05)
+    for _ in range(5):
+        breaker.record_failure()
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+
+# CallPolicy
+
+def test_retries_until_an_attempt_succeeds():
+    attempts = []
+
+    def fn(timeout):
+        attempts.append(timeout)
+        if len(attempts) < 3:
+            raise RuntimeError("flaky")
+        return "ok"
+
+    policy = CallPolicy(max_timeout=10, max_attempts=3, backoff=0)
+    assert policy.run(fn) == "ok"
+    assert len(attempts) == 3 and policy.retries == 2
+
+
+def test_raises_the_last_error_when_attempts_run_out():
+    policy = CallPolicy(max_timeout=10, max_attempts=2, backoff=0)
+    with pytest.raises(RuntimeError, match="down"):
+        policy.run(_failing())
+
+
+def test_unacceptable_results_are_retried_without_tripping_the_breaker():
+    policy = CallPolicy(max_timeout=10, max_attempts=3, backoff=0,
+                        breaker=CircuitBreaker(failure_threshold=1))
+    with pytest.raises(UnusableResponse):
+        policy.run(lambda timeout: "garbage", accept=lambda result: False)
+    assert policy.breaker.state == "closed"
+
+
+def test_open_breaker_fails_fast_without_calling():
+    calls = []
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    policy = CallPolicy(max_timeout=10, breaker=breaker)
+    with pytest.raises(CircuitOpenError):
+        policy.run(lambda timeout: calls.append(timeout))
+    assert calls == []
+
+
+def test_attempts_stay_within_the_time_budget():
+    timeouts = []
+
+    def fn(timeout):
+        timeouts.append(timeout)
+        time.sleep(0.1)
+        raise RuntimeError("slow failure")
+
+    policy = CallPolicy(max_timeout=10, max_attempts=10, backoff=0, budget=0.25)
+    start = time.monotonic()
+    with pytest.raises(RuntimeError):
+        policy.run(fn)
+    assert time.monotonic() - start < 0.4
+    assert len(timeouts) <= 3
+    assert all(t <= 0.25 for t in timeouts)
+
+
+def test_timeout_adapts_to_observed_latency():
+    policy = CallPolicy(max_timeout=120, min_timeout=1, timeout_multiplier=2, min_samples=20)
+    assert policy.timeout() == 120  # too few samples yet
+    for _ in range(20):
+        policy.latencies.record(3.0)
+    assert policy.timeout() == 6.0
+    for _ in range(200):
+        policy.latencies.record(0.01)
+    assert policy.timeout() == 1  # clamped to min_timeout
+
+
+def test_hedged_call_returns_the_faster_duplicate():
+    calls = []
+
+    def fn(timeout):
+        calls.append(timeout)
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return "straggler"
+        return "hedge"
+
+    policy = CallPolicy(max_timeout=10, hedge=True, min_samples=20)
+    for _ in range(20):
+        policy.latencies.record(0.05)
+    start = time.monotonic()
+    assert policy.run(fn) == "hedge"
+    assert time.monotonic() - start < 0.4
+    assert policy.hedges == 1
@@ -0,0 +1,33 @@
+import random
+
+from sayvdo.core import llm, sections
+from sayvdo.core.dimensions import risk_drift
+
+PREVIOUS = {
+    "dimension": "risk_drift",
+    "score": 64,
+    "evidence": ["We removed the customer concentration risk."],
+    "flags": ["Customer concentration risk dropped"],
+    "summary": "Material risk quietly removed.",
+    "mode": "diff",
+}
+
+
+def test_unchanged_risk_factors_keep_the_score_without_stale_evidence(monkeypatch):
+    rng = random.Random(3)
+    item_1a = "\n\n".join(
+        " ".join(f"term{rng.randrange(500)}" for _ in range(60)) + "." for _ in range(12)
+    )
+    monkeypatch.setattr(sections, "section", lambda filing, item: item_1a)
+    monkeypatch.setattr(risk_drift, "_previous_result", lambda ticker: PREVIOUS)
+
+    def no_model_call(*args, **kwargs):
+        raise AssertionError("an unchanged section needs no model call")
+
+    monkeypatch.setattr(llm, "ask", no_model_call)
+
+    result = risk_drift._score_diff("ACME", {"date": "2026-02-01"}, {"date": "2025-02-01"})
+    assert result["score"] == 64
+    assert result["evidence"] == [] and result["flags"] == []
+    assert "unchanged since the 2025-02-01 10-K" in result["summary"]
+    assert "mode" not in result
@@ -0,0 +1,76 @@
+import random
+
+from sayvdo.core import riskdiff
+
+_VOCABULARY = [f"term{i}" for i in range(2000)]
+
+
+def _paragraph(rng: random.Random, words: int = 60) -> str:
+    return " ".join(rng.choice(_VOCABULARY) for _ in range(words)) + "."
+
+
+def _reword(paragraph: str, every: int = 20) -> str:
+    words = paragraph.split()
+    for i in range(0, len(words), every):
+        words[i] = "reworded"
+    return " ".join(words)
+
+
+def _years(seed: int = 7) -> tuple[list[str], list[str]]:
+    rng = random.Random(seed)
+    prior = [_paragraph(rng) for _ in range(20)]
+    current = list(prior)
+    current[3] = _reword(current[3])   # reworded
+    current[5] = _paragraph(rng)       # replaced: one added, one removed
+    del current[10]                    # removed
+    current.append(_paragraph(rng))    # added
+    return prior, current
+
+
+def test_identical_sections_have_no_changes():
+    prior, _ = _years()
+    result = riskdiff.diff("\n".join(prior), "\n".join(prior))
+    assert result["unchanged"] == result["total"] == 20
+    assert not riskdiff.has_changes(result)
+
+
+def test_added_removed_and_reworded_paragraphs_are_classified():
+    prior, current = _years()
+    result = riskdiff.diff("\n".join(prior), "\n".join(current))
+
+    assert sorted(result["added"]) == sorted([current[5], current[-1]])
+    assert sorted(result["removed"]) == sorted([prior[5], prior[10]])
+    assert [(p, c) for p, c, _ in result["changed"]] == [(prior[3], current[3])]
+    assert result["unchanged"] == 17
+    assert result["total"] == len(current)
+    assert riskdiff.has_changes(result)
+
+
+def test_whitespace_and_case_changes_count_as_unchanged():
+    prior, _ = _years()
+    current = [p.upper().replace(" ", "  ") for p in prior]
+    assert not riskdiff.has_changes(riskdiff.diff("\n".join(prior), "\n".join(current)))
+
+
+def test_paragraphs_rejoin_lines_split_by_inline_markup():
+    section = "\n".join([
+        "Risks Related to Our Business",
+        "We depend on",
+        "third-party AI providers",
+        "for key features, and if they raise prices our margins could decline materially.",
+        "23",
+        "Table of Contents",
+        "Short heading.",
+    ])
+    assert riskdiff.paragraphs(section) == [
+        "Risks Related to Our Business We depend on third-party AI providers for key features, "
+        "and if they raise prices our margins could decline materially.",
+    ]
+
+
+def test_render_lists_each_kind_of_change():
+    prior, current = _years()
+    text = riskdiff.render(riskdiff.diff("\n".join(prior), "\n".join(current)))
+    assert "17 carried over unchanged, 1 reworded, 2 new, 2 removed" in text
+    for heading in ("NEW THIS YEAR", "REWORDED", "REMOVED SINCE PRIOR YEAR"):
+        assert heading in text
@@ -0,0 +1,77 @@
+import pytest
+
+from sayvdo.core import chunked, fused, scorer
+from sayvdo.core.dimensions import ai_narrative, capital_honesty
+
+ACCESSIONS = {
+    "10k": ["0000000001-26-000010"],
+    "10k_prior": ["0000000001-25-000010"],
+    "8ks": ["0000000001-26-000020", "0000000001-25-000090"],
+    "def14a": ["0000000001-26-000030"],
+}
+
+
+@pytest.fixture(autouse=True)
+def standard_mode(monkeypatch):
+    monkeypatch.setattr(scorer, "FUSED", False)
+    monkeypatch.setattr(chunked, "ENABLED", False)
+
+
+def _previous() -> dict:
+    """A stored result with every dimension scored under the current settings."""
+    dimensions, inputs = {}, {}
+    for module in scorer.SCORERS:
+        dim_name = module.__name__.split(".")[-1]
+        mode = scorer._mode(dim_name)
+        dimensions[dim_name] = {"dimension": dim_name, "score": 70, "evidence": [], "flags": [], "summary": ""}
+        inputs[dim_name] = {
+            "accessions": {key: ACCESSIONS[key] for key in scorer.INPUTS[dim_name]},
+            "content_sha256": "0" * 64,
+            "mode": mode,
+            "prompt_versions": scorer._prompt_versions(module, mode),
+        }
+    return {"dimensions": dimensions, "inputs": inputs}
+
+
+def test_unchanged_inputs_reuse_every_dimension():
+    assert sorted(scorer._reusable(_previous(), ACCESSIONS)) == sorted(scorer.INPUTS)
+
+
+def test_new_accession_rescores_only_the_dimensions_that_read_it():
+    current = {**ACCESSIONS, "def14a": ["0000000001-27-000030"]}
+    reused = scorer._reusable(_previous(), current)
+    assert sorted(reused) == ["ai_narrative", "guidance_accuracy", "risk_drift"]
+
+
+def test_mode_change_rescores_the_dimensions_it_applies_to(monkeypatch):
+    previous = _previous()
+    monkeypatch.setattr(chunked, "ENABLED", True)
+    assert sorted(scorer._reusable(previous, ACCESSIONS)) == ["risk_drift"]
+
+
+def test_prompt_version_change_rescores_that_dimension(monkeypatch):
+    previous = _previous()
+    monkeypatch.setattr(ai_narrative, "PROMPT_VERSION", ai_narrative.PROMPT_VERSION + 1)
+    reused = scorer._reusable(previous, ACCESSIONS)
+    assert sorted(reused) == ["capital_honesty", "esg_substance", "guidance_accuracy", "risk_drift"]
+
+
+def test_chunked_map_prompt_change_rescores_chunked_dimensions_only(monkeypatch):
+    monkeypatch.setattr(chunked, "ENABLED", True)
+    previous = _previous()
+    monkeypatch.setattr(chunked, "MAP_PROMPT_VERSION", chunked.MAP_PROMPT_VERSION + 1)
+    assert sorted(scorer._reusable(previous, ACCESSIONS)) == ["risk_drift"]
+
+
+def test_fused_dimensions_are_reused_together_or_not_at_all(monkeypatch):
+    monkeypatch.setattr(scorer, "FUSED", True)
+    previous = _previous()
+    assert previous["inputs"]["capital_honesty"]["prompt_versions"] == {"fused.PROMPT_VERSION": fused.PROMPT_VERSION}
+
+    # Only capital_honesty reads the proxy, but it can't be rescored alone
+    current = {**ACCESSIONS, "def14a": ["0000000001-27-000030"]}
+    assert sorted(scorer._reusable(previous, current)) == ["guidance_accuracy"]
+
+    # A per-dimension prompt change doesn't touch what fused mode produced
+    monkeypatch.setattr(capital_honesty, "PROMPT_VERSION", capital_honesty.PROMPT_VERSION + 1)
+    assert sorted(scorer._reusable(previous, ACCESSIONS)) == sorted(scorer.INPUTS)
@@ -0,0 +1,81 @@
+from sayvdo.core import sections
+
+
+def _body(topic: str, lines: int = 20) -> str:
+    return "\n".join(f"This paragraph discusses {topic} at length, line {i} of the section." for i in range(lines))
+
+
+TEN_K = "\n".join([
+    "UNITED STATES SECURITIES AND EXCHANGE COMMISSION",
+    "Table of Contents",
+    "Item 1. Business 3",
+    "Item 1A. Risk Factors 10",
+    "Item 7. Management's Discussion and Analysis 40",
+    "Item 9. Changes in and Disagreements with Accountants 80",
+    "PART I",
+    "Item 1. Business",
+    _body("the business"),
+    "Item 1A. Risk Factors",
+    _body("risks"),
+    "Item 7 of this report discusses liquidity in more detail.",
+    "Item 7.",
+    _body("more risks", 5),
+    "Item 7. Management's Discussion and Analysis",
+    _body("results of operations"),
+])
+
+
+def _text(found: dict, item: str) -> str:
+    start, end = found[item]
+    return TEN_K[start:end]
+
+
+def test_real_sections_win_over_table_of_contents_entries():
+    found = sections.split(TEN_K)
+    assert set(found) == {"1", "1A", "7"}
+    assert _text(found, "1").startswith("Item 1. Business\nThis paragraph discusses the business")
+    assert _text(found, "7").startswith("Item 7. Management's Discussion and Analysis\nThis paragraph")
+
+
+def test_items_only_in_the_table_of_contents_are_dropped():
+    assert "9" not in sections.split(TEN_K)
+
+
+def test_cross_references_do_not_cut_a_section_short():
+    risk = _text(sections.split(TEN_K), "1A")
+    assert "discusses risks" in risk and "discusses more risks" in risk
+    assert "results of operations" not in risk
+
+
+def test_prose_mentioning_an_item_is_not_a_heading():
+    found = sections.split("Item 1. Business\n" + _body("x") + "\nItem 7 of this report discusses y.\n" + _body("z"))
+    assert set(found) == {"1"}
+
+
+def test_excerpt_shares_the_budget_across_items():
+    text = "\n".join(["Item 1. Business", _body("x", 2), "Item 7. MD&A", _body("y", 50)])
+    found = sections.split(text)
+    item_1 = text[found["1"][0]:found["1"][1]]
+    budget = 1000
+    assert len(item_1) < budget // 2
+
+    item_7_start = found["7"][0]
+    # Item 1 used less than its half, so Item 7 gets the rest
+    expected = item_1 + "\n\n" + text[item_7_start:item_7_start + budget - len(item_1)]
+    assert sections.excerpt({"text": text}, ("1", "7"), budget) == expected
+
+
+def test_excerpt_is_none_when_no_item_is_found():
+    assert sections.excerpt({"text": "no headings here"}, ("1A",), 1000) is None
+
+
+def test_compensation_discussion_skips_table_of_contents():
+    prose = "Our executive compensation program rewards long-term value creation for shareholders. " * 3
+    proxy = "\n".join(
+        ["NOTICE OF ANNUAL MEETING", "Table of Contents", "Compensation Discussion and Analysis 34"]
+        + [f"Section {i} {i * 3}" for i in range(12)]
+        + ["COMPENSATION DISCUSSION AND ANALYSIS", "Executive Summary", prose, prose]
+    )
+    text = sections.compensation_discussion({"text": proxy}, 60)
+    assert text.startswith("COMPENSATION DISCUSSION AND ANALYSIS\nExecutive Summary")
+    assert len(text) == 60
@@ -0,0 +1,81 @@
+import threading
+import time
+
+import pytest
+
+from sayvdo.core.singleflight import Group
+
+
+def _start_waiters(group: Group, key, fn, n: int) -> tuple[list, list[threading.Thread]]:
+    outcomes = []
+
+    def call():
+        try:
+            outcomes.append(group.do(key, fn))
+        except Exception as e:
+            outcomes.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(n)]
+    for thread in threads:
+        thread.start()
+    return outcomes, threads
+
+
+def test_concurrent_callers_share_one_execution():
+    group, release, calls = Group(), threading.Event(), []
+
+    def fn():
+        calls.append(1)
+        release.wait(5)
+        return object()
+
+    outcomes, threads = _start_waiters(group, "k", fn, 5)
+    time.sleep(0.1)  # let every caller join the flight
+    assert group.in_flight("k")
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len(outcomes) == 5 and all(o is outcomes[0] for o in outcomes)
+    assert not group.in_flight("k")
+
+
+def test_waiters_receive_the_leaders_exception():
+    group, release = Group(), threading.Event()
+    error = ValueError("boom")
+
+    def fn():
+        release.wait(5)
+        raise error
+
+    outcomes, threads = _start_waiters(group, "k", fn, 3)
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert outcomes == [error] * 3
+
+
+def test_nothing_is_cached_after_a_call():
+    group, calls = Group(), []
+    group.do("k", calls.append, 1)
+    group.do("k", calls.append, 2)
+    assert calls == [1, 2]
+
+
+def test_different_keys_run_independently():
+    group, release = Group(), threading.Event()
+    outcomes, threads = _start_waiters(group, "slow", lambda: release.wait(5), 1)
+    time.sleep(0.05)
+    assert group.do("fast", lambda: "done") == "done"
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert outcomes == [True]
+
+
+def test_exception_propagates_to_a_lone_caller():
+    with pytest.raises(KeyError):
+        Group().do("k", {}.__getitem__, "missing")
@@ -0,0 +1,41 @@
+import json
+import time
+
+import pytest
+
+from sayvdo.core import edgar, tickers
+
+RAW = {
+    "0": {"cik_str": 1067983, "ticker": "BRK-B", "title": "BERKSHIRE HATHAWAY INC"},
+    "1": {"cik_str": 1067983, "ticker": "BRK-A", "title": "BERKSHIRE HATHAWAY INC"},
+    "2": {"cik_str": 789019, "ticker": "MSFT", "title": "MICROSOFT CORP"},
+}
+
+
+@pytest.fixture
+def directory(tmp_path, monkeypatch):
+    monkeypatch.setattr(edgar, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(tickers, "_by_ticker", {})
+    monkeypatch.setattr(tickers, "_by_cik", {})
+    monkeypatch.setattr(tickers, "_checked_at", 0.0)
+    snapshot_path, meta_path = tickers._paths()
+    with open(snapshot_path, "w") as f:
+        json.dump(RAW, f)
+    with open(meta_path, "w") as f:
+        json.dump({"fetched_at": time.time()}, f)
+
+    def offline(*args, **kwargs):
+        raise AssertionError("a fresh snapshot needs no network call")
+
+    monkeypatch.setattr(edgar, "get", offline)
+
+
+def test_lookup_normalizes_share_class_tickers(directory):
+    assert tickers.lookup("brk.b") == {"ticker": "BRK-B", "cik": "1067983", "title": "BERKSHIRE HATHAWAY INC"}
+    assert tickers.lookup("NOPE") is None
+
+
+def test_lookup_cik_returns_the_primary_ticker(directory):
+    assert tickers.lookup_cik("0001067983")["ticker"] == "BRK-B"
+    assert tickers.lookup_cik(789019)["title"] == "MICROSOFT CORP"
+    assert tickers.lookup_cik(1) is None